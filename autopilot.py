@@ -0,0 +1,203 @@
+from typing import Callable, Dict, Optional, Tuple
+
+import config
+import world as sim
+from jump_arcs import JumpArc
+
+
+GROUND_CLEARANCE = 4  # obstacles whose bottom is this close to the ground are jumped
+CLUSTER_GAP = 12  # px between obstacles that are cleared in one jump
+CROUCH_LEAD_TIME = 0.25  # s before a low bird arrives to start ducking
+JUMP_MARGIN = 0.06  # s of slack an arc needs over an obstacle to be picked
+GUST_MARGIN = 0.12  # extra slack when a gust may start mid-jump
+STEER_CLEAR_TIME = 0.8  # s of open ground needed before steering
+HOME_DEADBAND = 24  # px the dino may drift from its start x before steering back
+HEIGHT_MARGIN = 3  # px of extra clearance; corner grazes count as hits
+
+
+class Autopilot:
+    """Scripted player for benchmarks, soak runs and balancing.
+
+    Every tick it looks at the nearest obstacle ahead of the dino (or a
+    meteor in reach) and sends the same input codes as the keyboard: jump
+    press/release (releasing on the next tick is a cut jump), a second press
+    at the apex for double jumps, crouch for low birds and left/right to
+    walk back against the wind. Timing comes from the world's precomputed
+    jump arcs, so a tick costs a handful of attribute reads.
+    """
+
+    def __init__(self):
+        self.jump_held = False
+        self.crouching = False
+        self.pending_double = False
+        self.move_dir = 0
+        self.home_x: Optional[float] = None
+        # Wind push on the dino (px/s) and how long it keeps blowing.
+        self.wind = 0.0
+        self.wind_left = 0.0
+        self.rise_times: Dict[Tuple[int, int], float] = {}
+
+    def reset(self) -> None:
+        self.jump_held = False
+        self.crouching = False
+        self.pending_double = False
+        self.move_dir = 0
+        self.home_x = None
+
+    def rise_time(self, arc: JumpArc, height: float) -> float:
+        """Seconds after take-off until the feet are above `height`."""
+        key = (id(arc), int(height))
+        cached = self.rise_times.get(key)
+        if cached is None:
+            cached = arc.air_time
+            for index, y in enumerate(arc.heights):
+                if y > height:
+                    cached = index * arc.dt
+                    break
+            self.rise_times[key] = cached
+        return cached
+
+    def closing(self, speed: float, t: float) -> float:
+        """Pixels an obstacle closes in on the dino over the next t seconds."""
+        return speed * t + self.wind * min(t, self.wind_left)
+
+    def update(self, world, send: Optional[Callable[[int], None]] = None) -> None:
+        if send is None:
+            send = world.apply_input
+        dino = world.dino
+        screen_x = dino.center_x - world.scroll
+        if self.home_x is None:
+            self.home_x = screen_x
+
+        speed = world.params.scroll_speed
+        pinned = screen_x <= 30
+        if not pinned or world.player_vel_x > 0:
+            speed += world.player_vel_x
+        self.wind = 0.0
+        self.wind_left = world.wind_time_left
+        if self.wind_left > 0 and not pinned:
+            self.wind = world.wind_dir * config.WIND_FORCE
+            if world.active_event == "STORM":
+                self.wind *= config.STORM_WIND_FORCE_MULT
+
+        if self.jump_held:
+            send(sim.INPUT_JUMP_RELEASE)
+            self.jump_held = False
+        if self.pending_double and not dino.on_ground and dino.velocity_y <= 0:
+            send(sim.INPUT_JUMP_PRESS)
+            send(sim.INPUT_JUMP_RELEASE)
+            self.pending_double = False
+
+        # The world keeps obstacle_list ordered by x.
+        target = None
+        right = 0.0
+        for obstacle in world.obstacle_list:
+            if obstacle.right < dino.left:
+                continue
+            if target is None:
+                target = obstacle
+                right = obstacle.right
+            elif obstacle.left - right <= CLUSTER_GAP and obstacle.bottom <= target.bottom:
+                right = max(right, obstacle.right)
+            else:
+                break
+        gap = target.left - dino.right if target is not None else float("inf")
+
+        self.steer(world, send, screen_x, gap > self.closing(speed, STEER_CLEAR_TIME))
+
+        low_bird = (
+            target is not None
+            and config.GROUND_Y + GROUND_CLEARANCE
+            < target.bottom
+            < config.GROUND_Y + config.DINO_STAND_HEIGHT
+        )
+        wants_crouch = low_bird and gap <= self.closing(speed, CROUCH_LEAD_TIME)
+        if wants_crouch != self.crouching:
+            send(sim.INPUT_CROUCH_PRESS if wants_crouch else sim.INPUT_CROUCH_RELEASE)
+            self.crouching = wants_crouch
+
+        if not dino.on_ground or speed <= 0:
+            return
+        if target is not None and target.bottom <= config.GROUND_Y + GROUND_CLEARANCE:
+            self.jump_over(world, target, right, speed, send)
+        elif gap > self.closing(speed, 1.5):
+            self.catch_meteor(world, send)
+
+    def steer(self, world, send, screen_x: float, clear: bool) -> None:
+        """Walk back to the start x, leaning into the wind, but only with open
+        ground ahead so the dino's speed is settled by the next take-off."""
+        dino = world.dino
+        if not dino.on_ground:
+            return
+        offset = screen_x - self.home_x
+        if not clear:
+            wanted = 0
+        elif offset > HOME_DEADBAND:
+            wanted = -1
+        elif offset < -HOME_DEADBAND:
+            wanted = 1
+        elif world.wind_time_left > 0:
+            wanted = -world.wind_dir
+        else:
+            wanted = 0
+        if wanted == self.move_dir:
+            return
+        if self.move_dir:
+            send(sim.INPUT_LEFT_RELEASE if self.move_dir < 0 else sim.INPUT_RIGHT_RELEASE)
+        if wanted:
+            send(sim.INPUT_LEFT_PRESS if wanted < 0 else sim.INPUT_RIGHT_PRESS)
+        self.move_dir = wanted
+
+    def jump_over(self, world, target, right, speed, send) -> None:
+        dino = world.dino
+        table = world.jump_table
+        height = target.top - config.GROUND_Y + HEIGHT_MARGIN
+        width = right - target.left
+
+        horizon = table.full.air_time
+        average = self.closing(speed, horizon) / horizon
+        if average <= 0:
+            return
+        pass_time = (width + dino.width) / average
+        margin = JUMP_MARGIN
+        if (
+            world.settings.enable_wind
+            and self.wind_left <= 0
+            and config.WIND_INTERVAL - world.wind_timer < horizon
+        ):
+            margin += GUST_MARGIN
+
+        kinds = ("cut", "full", "double") if dino.max_jumps > 1 else ("cut", "full")
+        for kind in kinds:
+            arc = table.arcs[kind]
+            if arc.time_above_height(height) >= pass_time + margin:
+                break
+        else:
+            # Nothing clears it outright; the highest jump is the best bet.
+            kind = kinds[-1]
+            arc = table.arcs[kind]
+
+        # Take off so the time above the obstacle is centred on its passing.
+        slack = max(arc.time_above_height(height) - pass_time, 0.0)
+        lead = self.closing(speed, self.rise_time(arc, height) + slack / 2)
+        if target.left - dino.right > lead:
+            return
+
+        send(sim.INPUT_JUMP_PRESS)
+        self.jump_held = kind == "cut"
+        self.pending_double = kind == "double"
+
+    def catch_meteor(self, world, send) -> None:
+        """Jump into a low meteor for the score bonus when the way is clear."""
+        dino = world.dino
+        arc = world.jump_table.full
+        for meteor in world.meteor_list:
+            if meteor.right < dino.left:
+                continue
+            height = meteor.bottom - config.GROUND_Y
+            if height >= arc.apex:
+                return
+            closing = meteor.velocity_x * world.params.speed_multiplier
+            if meteor.left - dino.right <= closing * self.rise_time(arc, height):
+                send(sim.INPUT_JUMP_PRESS)
+            return
@@ -0,0 +1,72 @@
+import numpy as np
+
+import config
+from physics import PhysicsParams
+
+
+class BatchPhysicsEngine:
+    """PhysicsEngine for many dinos stepped in lock-step.
+
+    Per-dino state lives in NumPy arrays indexed by dino, and update() applies
+    the same jump buffer, coyote time, gravity, air drag, terminal velocity,
+    ground snap and buffered-jump rules as PhysicsEngine + Dino to all of them
+    at once.
+    """
+
+    def __init__(self, count: int, height: float = config.DINO_STAND_HEIGHT):
+        self.count = count
+        self.height = np.full(count, float(height))
+        self.center_y = config.GROUND_Y + self.height / 2
+        self.velocity_y = np.zeros(count)
+        self.on_ground = np.ones(count, dtype=bool)
+        self.jump_count = np.zeros(count, dtype=np.int64)
+        self.max_jumps = np.ones(count, dtype=np.int64)
+        self.jump_buffer_left = np.zeros(count)
+        self.coyote_time_left = np.zeros(count)
+        self.pending_jump_velocity = np.zeros(count)
+
+    @property
+    def bottom(self) -> np.ndarray:
+        return self.center_y - self.height / 2
+
+    def request_jump(self, mask, jump_velocity) -> None:
+        """Dino.request_jump for every dino selected by `mask`."""
+        self.jump_buffer_left[mask] = config.JUMP_BUFFER_TIME
+        if np.ndim(jump_velocity):
+            self.pending_jump_velocity[mask] = np.asarray(jump_velocity)[mask]
+        else:
+            self.pending_jump_velocity[mask] = jump_velocity
+
+    def cut_jump(self, mask) -> None:
+        rising = np.asarray(mask) & (self.velocity_y > 0)
+        self.velocity_y[rising] *= config.JUMP_CUTOFF_MULT
+
+    def update(self, delta_time: float, params: PhysicsParams) -> None:
+        np.maximum(self.jump_buffer_left - delta_time, 0.0, out=self.jump_buffer_left)
+        np.maximum(self.coyote_time_left - delta_time, 0.0, out=self.coyote_time_left)
+
+        vy = self.velocity_y
+        vy -= params.gravity * delta_time
+        falling = vy < 0
+        vy[falling] += -vy[falling] * config.AIR_DRAG * delta_time
+        np.maximum(vy, -config.TERMINAL_VELOCITY, out=vy)
+        self.center_y += vy * delta_time
+
+        half_height = self.height / 2
+        landed = self.center_y - half_height <= config.GROUND_Y
+        self.center_y[landed] = config.GROUND_Y + half_height[landed]
+        vy[landed] = 0.0
+        self.on_ground |= landed
+        self.jump_count[landed] = 0
+        self.coyote_time_left[landed] = config.COYOTE_TIME
+
+        jumping = (self.jump_buffer_left > 0.0) & (
+            self.on_ground
+            | (self.jump_count < self.max_jumps)
+            | (self.coyote_time_left > 0.0)
+        )
+        vy[jumping] = self.pending_jump_velocity[jumping]
+        self.on_ground[jumping] = False
+        self.jump_count[jumping] += 1
+        self.jump_buffer_left[jumping] = 0.0
+        self.coyote_time_left[jumping] = 0.0
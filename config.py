@@ -20,6 +20,7 @@ DEV_FREEZE_RULES = False
 # ======================
 DEBUG_TEXT_COLOR = (90, 90, 90)
 SHOW_DEBUG_INFO = True
+DEBUG_TUNNELING = False  # count hits only the swept collision test catches
 
 # ======================
 # DAY / NIGHT
@@ -43,6 +44,12 @@ LEVEL_NIGHT_COLORS = [
     (175, 165, 190),
 ]
 
+# ======================
+# SIMULATION
+# ======================
+SIMULATION_TICK_RATE = 120  # fixed simulation steps per second
+MAX_SUBSTEPS = 8  # per rendered frame; extra backlog is dropped
+
 # ======================
 # GAMEPLAY
 # ======================
@@ -108,6 +115,13 @@ WIND_DURATION = 2.5
 WIND_FORCE = 180
 WIND_PARTICLE_RATE = 0.08
 
+# ======================
+# PARTICLE BUDGET
+# ======================
+PARTICLE_MAX_LIVE = 400  # hard cap; emits past it are dropped
+PARTICLE_TARGET_FPS = 60
+PARTICLE_FRAME_WINDOW = 30  # frames in the rolling frame-time average
+
 # ======================
 # POWERUPS / COINS
 # ======================
@@ -20,7 +20,7 @@ class Dino(arcade.SpriteSolidColor):
         self.crouch_width = DINO_CROUCH_WIDTH
         self.crouch_height = DINO_CROUCH_HEIGHT
 
-        self.models = DinoModels()
+        self.models = DinoModels.shared()
         self.current_texture = None
         self.anim_timer = 0.0
         self.anim_index = 0
@@ -1,4 +1,3 @@
-import random
 import arcade
 import config
 from graphics.assets import load_texture_or_none, load_texture_sequence
@@ -11,16 +10,18 @@ class FlyingObstacle(arcade.SpriteSolidColor):
             height=30,
             color=arcade.color.WHITE,
         )
-        self.anim_timer = 0.0
-        self.anim_index = 0
         self.textures = load_texture_sequence("assets/obstacles/bird", max_frames=6)
         if not self.textures:
             single = load_texture_or_none("assets/obstacles/bird.png")
             if single:
                 self.textures = [single]
+        self.reset(height_type)
+
+    def reset(self, height_type: str):
+        self.anim_timer = 0.0
+        self.anim_index = 0
         if self.textures:
             self.texture = self.textures[0]
-
         self.center_x = config.SCREEN_WIDTH + 50
 
         if height_type == "low":
@@ -35,7 +36,3 @@ class FlyingObstacle(arcade.SpriteSolidColor):
                 self.anim_timer = 0.0
                 self.anim_index = (self.anim_index + 1) % len(self.textures)
                 self.texture = self.textures[self.anim_index]
-        self.center_x -= config.OBSTACLE_SPEED * config.GAME_SPEED_MULTIPLIER * delta_time
-
-        if self.right < 0:
-            self.remove_from_sprite_lists()
@@ -1,13 +1,18 @@
 import arcade
-import config
+from physics import PhysicsParams
 
 
 class Meteor(arcade.SpriteSolidColor):
-    def __init__(self, x: float, y: float):
+    def __init__(self, x: float, y: float, obstacle_speed: float):
         super().__init__(18, 18, center_x=x, center_y=y, color=arcade.color.BLACK)
-        self.velocity_x = config.OBSTACLE_SPEED * 1.3
+        self.velocity_x = obstacle_speed * 1.3
 
-    def update(self, delta_time: float):
-        self.center_x -= self.velocity_x * config.GAME_SPEED_MULTIPLIER * delta_time
-        if self.right < 0:
-            self.remove_from_sprite_lists()
+    def reset(self, x: float, y: float, obstacle_speed: float):
+        self.position = x, y
+        self.velocity_x = obstacle_speed * 1.3
+
+    def update(self, delta_time: float, params: PhysicsParams):
+        # velocity_x is screen-relative; the world itself scrolls at scroll_speed.
+        self.center_x -= (
+            self.velocity_x * params.speed_multiplier - params.scroll_speed
+        ) * delta_time
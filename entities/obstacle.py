@@ -13,12 +13,8 @@ class Obstacle(arcade.SpriteSolidColor):
         tex = load_texture_or_none("assets/obstacles/cactus.png")
         if tex:
             self.texture = tex
+        self.reset()
 
+    def reset(self):
         self.center_x = config.SCREEN_WIDTH + config.OBSTACLE_WIDTH
         self.center_y = config.GROUND_Y + config.OBSTACLE_HEIGHT // 2
-
-    def update(self, delta_time: float = 0) -> None:
-        self.center_x -= config.OBSTACLE_SPEED * config.GAME_SPEED_MULTIPLIER * delta_time
-
-        if self.right < 0:
-            self.remove_from_sprite_lists()
@@ -1,91 +1,213 @@
 import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
 import arcade
-from typing import Tuple
+import numpy as np
+
+import config
+from config import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+@dataclass(frozen=True)
+class ParticlePreset:
+    """Spawn ranges for one kind of particle.
+
+    Sizes are inclusive randint ranges; a preset without `height` spawns
+    squares. Velocities are uniform ranges, with velocity_x multiplied by
+    the emit direction.
+    """
+
+    width: Tuple[int, int]
+    height: Optional[Tuple[int, int]]
+    velocity_x: Tuple[float, float]
+    velocity_y: Tuple[float, float]
+    life: float
+    color: Tuple[int, int, int] = arcade.color.BLACK[:3]
+    fade: bool = True
+    alpha: int = 255
+
 
+DUST_PARTICLE = ParticlePreset((4, 8), None, (-40, -10), (10, 40), life=0.5)
+LAND_PARTICLE = ParticlePreset((6, 12), None, (-80, 60), (20, 80), life=0.7)
+WIND_PARTICLE = ParticlePreset(
+    (28, 46), (4, 6), (160, 240), (-10, 10), life=0.8, alpha=220
+)
+
+
+class ParticleBudget:
+    """Trades particle count for frame time.
+
+    record_frame() keeps a rolling average of per-frame CPU time. While it
+    runs over the target the budget sheds a level; while comfortably under,
+    it climbs back. Each level cuts emission and grows particles by
+    1/sqrt(emission), so the screen keeps roughly the same coverage from
+    fewer particles. After a change the level holds for HOLD_TIME seconds
+    of wall-clock time so the average can settle.
+    """
+
+    LEVELS = (1.0, 0.6, 0.35, 0.2)
+    SHED_ABOVE = 1.0  # of the target frame time
+    CLIMB_BELOW = 0.6
+    HOLD_TIME = 0.5
 
-class Particle(arcade.SpriteSolidColor):
     def __init__(
         self,
-        width: int,
-        height: int,
-        color: Tuple[int, int, int],
-        life: float,
-        velocity_x: float,
-        velocity_y: float,
-        center_x: float,
-        center_y: float,
-        fade: bool = True,
-        alpha: int = 255,
+        target_fps: float = config.PARTICLE_TARGET_FPS,
+        window: int = config.PARTICLE_FRAME_WINDOW,
     ):
-        super().__init__(
-            width, height, center_x=center_x, center_y=center_y, color=color
-        )
-        self.life = life
-        self.start_life = life
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.fade = fade
-        self.alpha = alpha
-
-    def update(self, delta_time: float):
-        self.center_x += self.velocity_x * delta_time
-        self.center_y += self.velocity_y * delta_time
-
-        self.life -= delta_time
-        if self.fade and self.start_life > 0:
-            t = max(self.life / self.start_life, 0.0)
-            self.alpha = int(255 * t)
-
-        if self.life <= 0:
-            self.remove_from_sprite_lists()
-
-
-def make_dust_particle(x: float, y: float) -> Particle:
-    size = random.randint(4, 8)
-    vx = random.uniform(-40, -10)
-    vy = random.uniform(10, 40)
-    return Particle(
-        size,
-        size,
-        arcade.color.BLACK,
-        life=0.5,
-        velocity_x=vx,
-        velocity_y=vy,
-        center_x=x,
-        center_y=y,
-    )
+        self.target = 1.0 / target_fps
+        self.samples = deque(maxlen=window)
+        self.total = 0.0
+        self.level = 0
+        self.hold = 0.0
 
+    @property
+    def average(self) -> float:
+        return self.total / len(self.samples) if self.samples else 0.0
+
+    @property
+    def emission(self) -> float:
+        return self.LEVELS[self.level]
+
+    @property
+    def size_scale(self) -> float:
+        return self.emission ** -0.5
+
+    def record_frame(self, frame_time: float, elapsed: float) -> None:
+        """`frame_time` is the CPU time spent on the frame, `elapsed` the
+        wall-clock time since the previous one (on_update's delta_time)."""
+        if len(self.samples) == self.samples.maxlen:
+            self.total -= self.samples[0]
+        self.samples.append(frame_time)
+        self.total += frame_time
+        self.hold = max(self.hold - elapsed, 0.0)
+        if self.hold > 0.0 or len(self.samples) < self.samples.maxlen:
+            return
+        average = self.average
+        last = len(self.LEVELS) - 1
+        if average > self.target * self.SHED_ABOVE and self.level < last:
+            self.level += 1
+        elif average < self.target * self.CLIMB_BELOW and self.level > 0:
+            self.level -= 1
+        else:
+            return
+        self.hold = self.HOLD_TIME
 
-def make_land_particle(x: float, y: float) -> Particle:
-    size = random.randint(6, 12)
-    vx = random.uniform(-80, 60)
-    vy = random.uniform(20, 80)
-    return Particle(
-        size,
-        size,
-        arcade.color.BLACK,
-        life=0.7,
-        velocity_x=vx,
-        velocity_y=vy,
-        center_x=x,
-        center_y=y,
-    )
 
+class ParticleEmitter:
+    """Screen-space particles stored in preallocated NumPy arrays.
 
-def make_wind_particle(x: float, y: float, direction: int) -> Particle:
-    width = random.randint(28, 46)
-    height = random.randint(4, 6)
-    vx = direction * random.uniform(160, 240)
-    vy = random.uniform(-10, 10)
-    return Particle(
-        width,
-        height,
-        arcade.color.BLACK,
-        life=0.8,
-        velocity_x=vx,
-        velocity_y=vy,
-        center_x=x,
-        center_y=y,
-        fade=True,
-        alpha=220,
+    `capacity` is a hard cap: emits beyond it are dropped. `budget` scales
+    how many emits become particles, and how large. Slots [0, count) are
+    live. update() moves, ages and fades all of them
+    in one vectorized step, then culls expired or off-screen particles by
+    moving live ones from the tail into the freed slots, so the live range
+    stays packed for a single batched draw. prev_x/prev_y hold positions
+    from the last snapshot() for render interpolation.
+    """
+
+    CULL_MARGIN = 64
+    FIELDS = (
+        ("x", np.float64),
+        ("y", np.float64),
+        ("prev_x", np.float64),
+        ("prev_y", np.float64),
+        ("velocity_x", np.float64),
+        ("velocity_y", np.float64),
+        ("width", np.float32),
+        ("height", np.float32),
+        ("life", np.float64),
+        ("start_life", np.float64),
+        ("alpha", np.float64),
+        ("fade", np.bool_),
+        ("color", np.uint8),
     )
+
+    def __init__(self, capacity: int = config.PARTICLE_MAX_LIVE, budget=None):
+        self.count = 0
+        self.capacity = capacity
+        self.budget = budget if budget is not None else ParticleBudget()
+        # Fractional emits carried per preset while the budget is cut.
+        self.owed = {}
+        self.dropped = 0
+        for name, dtype in self.FIELDS:
+            shape = (capacity, 3) if name == "color" else capacity
+            setattr(self, name, np.zeros(shape, dtype=dtype))
+
+    def clear(self) -> None:
+        self.count = 0
+        self.owed.clear()
+
+    def emit(
+        self,
+        preset: ParticlePreset,
+        x: float,
+        y: float,
+        rng=random,
+        direction: int = 1,
+    ) -> None:
+        owed = self.owed.get(preset, 0.0) + self.budget.emission
+        if owed < 1.0:
+            self.owed[preset] = owed
+            return
+        self.owed[preset] = owed - 1.0
+        if self.count == self.capacity:
+            self.dropped += 1
+            return
+        # Same draw order as the old per-sprite presets, so a seed at full
+        # budget gives the same particles.
+        width = rng.randint(*preset.width)
+        height = rng.randint(*preset.height) if preset.height else width
+        vx = direction * rng.uniform(*preset.velocity_x)
+        vy = rng.uniform(*preset.velocity_y)
+        size_scale = self.budget.size_scale
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.velocity_x[i] = vx
+        self.velocity_y[i] = vy
+        self.width[i] = width * size_scale
+        self.height[i] = height * size_scale
+        self.life[i] = self.start_life[i] = preset.life
+        self.alpha[i] = preset.alpha
+        self.fade[i] = preset.fade
+        self.color[i] = preset.color
+        self.count = i + 1
+
+    def snapshot(self) -> None:
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def update(self, delta_time: float) -> None:
+        n = self.count
+        if not n:
+            return
+        x, y, life = self.x[:n], self.y[:n], self.life[:n]
+        x += self.velocity_x[:n] * delta_time
+        y += self.velocity_y[:n] * delta_time
+        life -= delta_time
+        fade = self.fade[:n]
+        t = life[fade] / self.start_life[:n][fade]
+        self.alpha[:n][fade] = 255 * np.maximum(t, 0.0)
+
+        margin = self.CULL_MARGIN
+        dead = (
+            (life <= 0)
+            | (x < -margin)
+            | (x > SCREEN_WIDTH + margin)
+            | (y < -margin)
+            | (y > SCREEN_HEIGHT + margin)
+        )
+        dead_count = int(np.count_nonzero(dead))
+        if not dead_count:
+            return
+        alive = n - dead_count
+        holes = np.flatnonzero(dead[:alive])
+        movers = np.flatnonzero(~dead[alive:]) + alive
+        for name, _dtype in self.FIELDS:
+            array = getattr(self, name)
+            array[holes] = array[movers]
+        self.count = alive
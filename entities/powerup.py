@@ -1,5 +1,4 @@
 import arcade
-import config
 from graphics.assets import load_texture_or_none
 
 
@@ -11,15 +10,17 @@ POWERUP_COLORS = {
 
 
 class PowerUp(arcade.SpriteSolidColor):
+    SIZE = 24
+
     def __init__(self, kind: str, x: float, y: float):
-        color = POWERUP_COLORS.get(kind, arcade.color.WHITE)
-        super().__init__(24, 24, center_x=x, center_y=y, color=color)
+        super().__init__(self.SIZE, self.SIZE, center_x=x, center_y=y)
+        self.solid_texture = self.texture
+        self.reset(kind, x, y)
+
+    def reset(self, kind: str, x: float, y: float):
+        # Pooled powerups change kind, so colour and texture are reapplied.
         self.kind = kind
+        self.position = x, y
+        self.color = POWERUP_COLORS.get(kind, arcade.color.WHITE)
         tex = load_texture_or_none(f"assets/powerups/{kind}.png")
-        if tex:
-            self.texture = tex
-
-    def update(self, delta_time: float):
-        self.center_x -= config.OBSTACLE_SPEED * config.GAME_SPEED_MULTIPLIER * delta_time
-        if self.right < 0:
-            self.remove_from_sprite_lists()
+        self.texture = tex or self.solid_texture
@@ -1,11 +1,24 @@
+import json
 import os
 import sys
+from typing import Dict, Optional
+
 import arcade
 import config
+from PIL import Image
 
 
-def has_valid_asset(path: str) -> bool:
-    return os.path.exists(path) and os.path.getsize(path) > 0
+ASSET_ROOT = "assets"
+# Written by tools/build_atlas.py; optional, individual files are the fallback.
+ATLAS_IMAGE = "assets/atlas.png"
+ATLAS_INDEX = "assets/atlas.json"
+
+# Relative path -> size of every non-empty file under ASSET_ROOT, filled by
+# one directory walk. Lookups after that never touch the filesystem.
+_manifest: Optional[Dict[str, int]] = None
+# Relative path -> texture, or None for a file the manifest does not have.
+_textures: Dict[str, Optional[arcade.Texture]] = {}
+texture_stats = {"hits": 0, "loads": 0, "missing": 0, "atlas": 0}
 
 
 def resource_path(relative_path: str) -> str:
@@ -13,10 +26,61 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+def scan_assets() -> Dict[str, int]:
+    global _manifest
+    manifest = {}
+    root = resource_path(ASSET_ROOT)
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            size = os.path.getsize(full)
+            if size > 0:
+                rel = os.path.relpath(full, resource_path("."))
+                manifest[rel.replace(os.sep, "/")] = size
+    _manifest = manifest
+    _textures.clear()
+    return manifest
+
+
+def has_valid_asset(path: str) -> bool:
+    manifest = _manifest if _manifest is not None else scan_assets()
+    return os.path.normpath(path).replace(os.sep, "/") in manifest
+
+
+def load_atlas() -> int:
+    """Cache a texture for every region of the packed atlas, if there is one.
+
+    The atlas is the only image decoded; each region becomes a texture over
+    a crop of it, keyed by its original asset path. Returns the region count.
+    """
+    if not (has_valid_asset(ATLAS_IMAGE) and has_valid_asset(ATLAS_INDEX)):
+        return 0
+    with open(resource_path(ATLAS_INDEX), encoding="utf-8") as f:
+        regions = json.load(f)["regions"]
+    with Image.open(resource_path(ATLAS_IMAGE)) as image:
+        atlas = image.convert("RGBA")
+    for path, (x, y, w, h) in regions.items():
+        _textures[path] = arcade.Texture(
+            atlas.crop((x, y, x + w, y + h)), hash=f"atlas:{path}"
+        )
+    texture_stats["atlas"] = len(regions)
+    return len(regions)
+
+
+def preload() -> None:
+    """Scan assets/ and, in sprite mode, load every image up front."""
+    manifest = scan_assets()
+    if config.USE_SPRITES:
+        load_atlas()
+        for path in manifest:
+            if path.endswith(".png") and path != ATLAS_IMAGE:
+                load_texture_or_none(path)
+
+
 def load_sprite_or_solid(path: str, width: int, height: int, color):
-    resolved = resource_path(path)
-    if config.USE_SPRITES and has_valid_asset(resolved):
-        sprite = arcade.Sprite(resolved)
+    tex = load_texture_or_none(path)
+    if tex:
+        sprite = arcade.Sprite(tex)
         sprite.width = width
         sprite.height = height
         return sprite
@@ -24,10 +88,19 @@ def load_sprite_or_solid(path: str, width: int, height: int, color):
 
 
 def load_texture_or_none(path: str):
-    resolved = resource_path(path)
-    if config.USE_SPRITES and has_valid_asset(resolved):
-        return arcade.load_texture(resolved)
-    return None
+    if not config.USE_SPRITES:
+        return None
+    if path in _textures:
+        texture_stats["hits"] += 1
+        return _textures[path]
+    if has_valid_asset(path):
+        tex = arcade.load_texture(resource_path(path))
+        texture_stats["loads"] += 1
+    else:
+        tex = None
+        texture_stats["missing"] += 1
+    _textures[path] = tex
+    return tex
 
 
 def load_texture_sequence(prefix: str, max_frames: int = 8):
@@ -17,3 +17,12 @@ class DinoModels:
 
         self.jump_texture = load_texture_or_none("assets/dino/jump.png")
         self.crouch_texture = load_texture_or_none("assets/dino/crouch.png")
+
+    _shared = None
+
+    @classmethod
+    def shared(cls) -> "DinoModels":
+        # The textures never change, so every Dino uses one instance.
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
@@ -0,0 +1,186 @@
+import arcade
+import numpy as np
+from arcade.gl import BufferDescription
+
+
+# One row per rectangle: centre, size, RGBA colour, and an optional border
+# of `border` pixels inside the edge in `border_color`.
+RECT_DTYPE = np.dtype(
+    [
+        ("position", "f4", 2),
+        ("size", "f4", 2),
+        ("color", "u1", 4),
+        ("border", "f4"),
+        ("border_color", "u1", 4),
+    ]
+)
+
+VERTEX_SHADER = """
+#version 330
+
+uniform WindowBlock {
+    mat4 projection;
+    mat4 view;
+} window;
+
+in vec2 in_vert;
+in vec2 in_position;
+in vec2 in_size;
+in vec4 in_color;
+in float in_border;
+in vec4 in_border_color;
+
+out vec4 v_color;
+out vec4 v_border_color;
+out vec2 v_local;
+out vec2 v_half;
+out float v_border;
+
+void main() {
+    v_color = in_color;
+    v_border_color = in_border_color;
+    v_local = in_vert * in_size;
+    v_half = in_size * 0.5;
+    v_border = in_border;
+    vec2 pos = in_position + v_local;
+    gl_Position = window.projection * window.view * vec4(pos, 0.0, 1.0);
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 330
+
+in vec4 v_color;
+in vec4 v_border_color;
+in vec2 v_local;
+in vec2 v_half;
+in float v_border;
+out vec4 f_color;
+
+void main() {
+    vec2 inside = v_half - abs(v_local);
+    f_color = min(inside.x, inside.y) < v_border ? v_border_color : v_color;
+}
+"""
+
+
+class RectBatch:
+    """Filled axis-aligned rectangles kept in a GPU buffer, drawn in one call.
+
+    Rows live in `rects` (a NumPy view over RECT_DTYPE). Callers write rows
+    and mark the changed range dirty; draw() uploads only that range and
+    renders every row as an instance of one quad. Positions go through the
+    current camera like any other arcade draw.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.data = np.zeros(capacity, dtype=RECT_DTYPE)
+        self.count = 0
+        self.dirty_start = 0
+        self.dirty_stop = 0
+        self.program = None
+        self.quad = None
+        self.buffer = None
+        self.geometry = None
+
+    @property
+    def rects(self) -> np.ndarray:
+        return self.data[: self.count]
+
+    def resize(self, count: int) -> None:
+        """Set the row count, growing storage if needed. New rows start dirty."""
+        if count > len(self.data):
+            data = np.zeros(max(count, len(self.data) * 2), dtype=RECT_DTYPE)
+            data[: self.count] = self.data[: self.count]
+            self.data = data
+        if count > self.count:
+            self.mark_dirty(self.count, count)
+        self.count = count
+
+    def mark_dirty(self, start: int, stop: int) -> None:
+        if self.dirty_start == self.dirty_stop:
+            self.dirty_start, self.dirty_stop = start, stop
+        else:
+            self.dirty_start = min(self.dirty_start, start)
+            self.dirty_stop = max(self.dirty_stop, stop)
+
+    def draw(self) -> None:
+        ctx = arcade.get_window().ctx
+        if self.program is None:
+            self.program = ctx.program(
+                vertex_shader=VERTEX_SHADER, fragment_shader=FRAGMENT_SHADER
+            )
+            quad = np.array([-0.5, -0.5, 0.5, -0.5, -0.5, 0.5, 0.5, 0.5], dtype="f4")
+            self.quad = ctx.buffer(data=quad)
+        if self.buffer is None or self.buffer.size < self.data.nbytes:
+            # Storage grew: reallocate and upload every row.
+            self.buffer = ctx.buffer(reserve=self.data.nbytes)
+            self.geometry = ctx.geometry(
+                [
+                    BufferDescription(self.quad, "2f", ["in_vert"]),
+                    BufferDescription(
+                        self.buffer,
+                        "2f 2f 4f1 1f 4f1",
+                        [
+                            "in_position",
+                            "in_size",
+                            "in_color",
+                            "in_border",
+                            "in_border_color",
+                        ],
+                        instanced=True,
+                    ),
+                ],
+                mode=ctx.TRIANGLE_STRIP,
+            )
+            self.dirty_start, self.dirty_stop = 0, self.count
+        stop = min(self.dirty_stop, self.count)
+        if self.dirty_start < stop:
+            self.buffer.write(
+                self.data[self.dirty_start : stop],
+                offset=self.dirty_start * RECT_DTYPE.itemsize,
+            )
+        self.dirty_start = self.dirty_stop = 0
+        if self.count:
+            self.geometry.render(self.program, instances=self.count)
+
+
+class KeyedRectBatch(RectBatch):
+    """RectBatch with one row per key (typically a sprite), patched in place.
+
+    set() gives a new key a free slot, or rewrites the row of a known one;
+    discard() blanks a key's slot for reuse. Only touched rows are marked
+    dirty, so draw() uploads just that range. Rows are drawn in slot
+    order, so overlapping keys have no defined order.
+    """
+
+    def __init__(self, capacity: int = 64):
+        super().__init__(capacity)
+        self.slots = {}
+        self.free = []
+
+    def set(self, key, row) -> None:
+        """Store `row`, a RECT_DTYPE row tuple, under `key`."""
+        index = self.slots.get(key)
+        if index is None:
+            if self.free:
+                index = self.free.pop()
+            else:
+                index = self.count
+                self.resize(index + 1)
+            self.slots[key] = index
+        self.data[index] = row
+        self.mark_dirty(index, index + 1)
+
+    def discard(self, key) -> None:
+        index = self.slots.pop(key, None)
+        if index is None:
+            return
+        self.data[index] = 0
+        self.free.append(index)
+        self.mark_dirty(index, index + 1)
+
+    def clear(self) -> None:
+        self.slots.clear()
+        self.free.clear()
+        self.count = 0
@@ -0,0 +1,85 @@
+import arcade
+
+from graphics.rects import KeyedRectBatch, RectBatch
+
+
+NO_BORDER = (0, 0, 0, 0)
+OBSTACLE_BORDER = 2
+
+
+class ShapeRenderer:
+    """Hitbox-mode (USE_SPRITES = False) drawing of a World in two calls.
+
+    Coins, powerups and obstacles sit still in world space, so their rows
+    are kept in a KeyedRectBatch that listens to the world (see
+    World.static_listeners) and is only patched when one spawns or
+    despawns. Meteors and dinos move every frame and are rewritten into a
+    small RectBatch at their interpolated positions. Call draw() with the
+    world camera active.
+    """
+
+    def __init__(self):
+        self.static = KeyedRectBatch()
+        self.moving = RectBatch(capacity=8)
+        self.world = None
+
+    def attach(self, world) -> None:
+        """Mirror `world`'s static sprites, detaching from any previous world."""
+        if self.world is not None:
+            self.world.static_listeners.remove(self)
+        self.world = world
+        world.static_listeners.append(self)
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        world = self.world
+        self.static.clear()
+        for sprite_list in (world.coin_list, world.powerup_list, world.obstacle_list):
+            for sprite in sprite_list:
+                self.spawned(sprite, sprite_list)
+
+    def spawned(self, sprite, sprite_list) -> None:
+        if sprite_list is self.world.obstacle_list:
+            # White fill with a black outline centred on the hitbox edge.
+            pad = OBSTACLE_BORDER
+            row = (
+                sprite.position,
+                (sprite.width + pad, sprite.height + pad),
+                arcade.color.WHITE,
+                pad,
+                arcade.color.BLACK,
+            )
+        else:
+            row = (sprite.position, sprite.size, sprite.color, 0.0, NO_BORDER)
+        self.static.set(sprite, row)
+
+    def despawned(self, sprite) -> None:
+        self.static.discard(sprite)
+
+    def shifted(self, dx: float) -> None:
+        # Rare (once per SCROLL_REBASE); rebuilding from the sprites avoids
+        # the float32 rounding of shifting rows near the rebase point.
+        self.rebuild()
+
+    def draw(self, world, alpha: float, offset) -> None:
+        if world is not self.world:
+            self.attach(world)
+        self.static.draw()
+
+        moving = self.moving
+        moving.resize(len(world.meteor_list) + len(world.dino_list))
+        data = moving.data
+        i = 0
+        for sprite_list in (world.meteor_list, world.dino_list):
+            for sprite in sprite_list:
+                dx, dy = offset(sprite, alpha)
+                data[i] = (
+                    (sprite.center_x + dx, sprite.center_y + dy),
+                    sprite.size,
+                    sprite.color,
+                    0.0,
+                    NO_BORDER,
+                )
+                i += 1
+        moving.mark_dirty(0, moving.count)
+        moving.draw()
@@ -0,0 +1,189 @@
+import math
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import config
+
+
+JUMP_KINDS = ("full", "cut", "double")
+ENVELOPE_DX_STEP = 4  # px between envelope samples
+MAX_TABLES = 32  # least recently used tables beyond this are dropped
+
+
+def speed_presets() -> Tuple[float, float, float]:
+    return (
+        config.OBSTACLE_SPEED_SLOW,
+        config.OBSTACLE_SPEED_NORMAL,
+        config.OBSTACLE_SPEED_FAST,
+    )
+
+
+def jump_velocity(jump_multiplier: float) -> float:
+    return config.GRAVITY_NORMAL * config.JUMP_TIME_TO_APEX * jump_multiplier
+
+
+def simulate_heights(
+    gravity: float,
+    velocity: float,
+    dt: float,
+    cut_after: Optional[int] = None,
+    double_at_apex: bool = False,
+) -> List[float]:
+    """Height above ground after each fixed step of one jump, until landing.
+
+    Mirrors PhysicsEngine.update: gravity, drag while falling, terminal
+    velocity, then position. `cut_after` releases the jump key after that
+    many steps (Dino.cut_jump); 0 releases it on the tick after the press,
+    before the first step, which is the earliest the game can.
+    `double_at_apex` jumps again at the apex.
+    """
+    heights = [0.0]
+    y = 0.0
+    vy = velocity
+    doubled = False
+    step = 0
+    while True:
+        if cut_after is not None and step == cut_after and vy > 0:
+            vy *= config.JUMP_CUTOFF_MULT
+        step += 1
+        vy -= gravity * dt
+        if vy < 0:
+            vy += -vy * config.AIR_DRAG * dt
+        if vy < -config.TERMINAL_VELOCITY:
+            vy = -config.TERMINAL_VELOCITY
+        y += vy * dt
+        if y <= 0.0:
+            heights.append(0.0)
+            return heights
+        heights.append(y)
+        if double_at_apex and not doubled and vy <= 0:
+            vy = velocity
+            doubled = True
+
+
+class JumpArc:
+    """One jump trajectory sampled at the simulation tick.
+
+    All queries are table lookups: height after t seconds or dx pixels of
+    scrolling, and how long (or how far) the dino stays above a height.
+    """
+
+    def __init__(self, heights: List[float], dt: float):
+        self.heights = heights
+        self.dt = dt
+        self.air_time = (len(heights) - 1) * dt
+        self.apex = max(heights)
+        # time_above[h]: seconds spent strictly above h px (arcs are single-peaked).
+        self.time_above = [0.0] * (int(math.ceil(self.apex)) + 1)
+        for y in heights:
+            for h in range(min(int(math.ceil(y)), len(self.time_above))):
+                self.time_above[h] += dt
+
+    def height_at(self, t: float) -> float:
+        index = int(t / self.dt)
+        if index < 0 or index >= len(self.heights):
+            return 0.0
+        return self.heights[index]
+
+    def height_at_dx(self, dx: float, speed: float) -> float:
+        if speed <= 0:
+            return 0.0
+        return self.height_at(dx / speed)
+
+    def time_above_height(self, height: float) -> float:
+        index = max(0, int(math.ceil(height)))
+        if index >= len(self.time_above):
+            return 0.0
+        return self.time_above[index]
+
+    def clear_distance(self, height: float, speed: float) -> float:
+        """Horizontal distance scrolled by while the dino is above `height`."""
+        return self.time_above_height(height) * speed
+
+    def can_clear(self, height: float, width: float, speed: float) -> bool:
+        """Whether a well-timed jump gets the dino's feet over an obstacle
+        `height` px tall and `width` px wide moving at `speed` px/s."""
+        return self.clear_distance(height, speed) >= width + config.DINO_STAND_WIDTH
+
+
+class JumpTable:
+    """Full, cut and double jump arcs for one gravity/jump multiplier and
+    step time, plus (dx, height) envelopes at each obstacle speed preset."""
+
+    def __init__(self, gravity: float, jump_multiplier: float, dt: float):
+        self.gravity = gravity
+        self.jump_multiplier = jump_multiplier
+        self.dt = dt
+        velocity = jump_velocity(jump_multiplier)
+        self.arcs: Dict[str, JumpArc] = {
+            "full": JumpArc(simulate_heights(gravity, velocity, dt), dt),
+            "cut": JumpArc(simulate_heights(gravity, velocity, dt, cut_after=0), dt),
+            "double": JumpArc(
+                simulate_heights(gravity, velocity, dt, double_at_apex=True), dt
+            ),
+        }
+        self.envelopes: Dict[Tuple[str, float], List[float]] = {}
+        for kind, arc in self.arcs.items():
+            for speed in speed_presets():
+                reach = int(arc.air_time * speed)
+                self.envelopes[(kind, speed)] = [
+                    arc.height_at_dx(dx, speed)
+                    for dx in range(0, reach + ENVELOPE_DX_STEP, ENVELOPE_DX_STEP)
+                ]
+
+    @property
+    def full(self) -> JumpArc:
+        return self.arcs["full"]
+
+    def envelope_height(self, kind: str, speed: float, dx: float) -> float:
+        """Height reached `dx` px after take-off at a speed preset."""
+        envelope = self.envelopes[(kind, speed)]
+        index = int(dx // ENVELOPE_DX_STEP)
+        if index < 0 or index >= len(envelope):
+            return 0.0
+        return envelope[index]
+
+
+_tables: "OrderedDict[tuple, JumpTable]" = OrderedDict()
+
+
+def table_key(gravity: float, jump_multiplier: float, dt: float) -> tuple:
+    # Everything a JumpTable is built from, so a run that overrides config
+    # (tools/balance) never plans with another run's arcs.
+    return (
+        gravity,
+        jump_multiplier,
+        dt,
+        config.GRAVITY_NORMAL,
+        config.JUMP_TIME_TO_APEX,
+        config.AIR_DRAG,
+        config.TERMINAL_VELOCITY,
+        config.JUMP_CUTOFF_MULT,
+        speed_presets(),
+    )
+
+
+def get_table(
+    gravity: float, jump_multiplier: float, dt: Optional[float] = None
+) -> JumpTable:
+    if dt is None:
+        dt = 1.0 / config.SIMULATION_TICK_RATE
+    key = table_key(gravity, jump_multiplier, dt)
+    table = _tables.get(key)
+    if table is None:
+        table = JumpTable(gravity, jump_multiplier, dt)
+        _tables[key] = table
+        # Bounded, so callers stepping with a variable dt don't grow it
+        # forever; a World keeps its current table alive either way.
+        if len(_tables) > MAX_TABLES:
+            _tables.popitem(last=False)
+    else:
+        _tables.move_to_end(key)
+    return table
+
+
+def precompute() -> None:
+    """Build the tables for every gravity preset up front."""
+    for gravity in (config.GRAVITY_LOW, config.GRAVITY_NORMAL, config.GRAVITY_HIGH):
+        raw_multiplier = math.sqrt(config.GRAVITY_NORMAL / gravity)
+        get_table(gravity, max(0.7, min(raw_multiplier, 1.35)))
@@ -1,9 +1,80 @@
+import argparse
+import math
+
 import arcade
+import jump_arcs
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
+from graphics import assets
+from systems import storage
+from systems.replay import Replay, ReplayPlayer
 from ui.views import AppContext, MainMenuView
 
 
+def positive_float(text):
+    value = float(text)
+    if not (value > 0 and math.isfinite(value)):
+        raise argparse.ArgumentTypeError(f"must be a finite number > 0, got {text}")
+    return value
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=SCREEN_TITLE)
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed every run with this value to make it reproducible",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        default=None,
+        help="save the input replay of each finished run to PATH",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        default=None,
+        help="play back a recorded run instead of taking keyboard input",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=positive_float,
+        default=1.0,
+        help="playback speed multiplier for --replay",
+    )
+    parser.add_argument(
+        "--autopilot",
+        action="store_true",
+        help="let the scripted bot play (its runs are not added to stats)",
+    )
+    parser.add_argument(
+        "--verify-replay",
+        metavar="PATH",
+        default=None,
+        help="re-simulate a replay headless, print its score and exit",
+    )
+    return parser.parse_args()
+
+
+def verify_replay(path):
+    replay = Replay.load(path)
+    world = ReplayPlayer(replay).run()
+    ok = world.tick == replay.end_tick and world.score == replay.score
+    print(
+        f"seed={replay.seed} ticks={world.tick} score={world.score:.2f} "
+        f"recorded={replay.score:.2f} {'OK' if ok else 'MISMATCH'}"
+    )
+    return 0 if ok else 1
+
+
 def main():
+    args = parse_args()
+    if args.verify_replay:
+        raise SystemExit(verify_replay(args.verify_replay))
+    replay = Replay.load(args.replay) if args.replay else None
+    jump_arcs.precompute()
+    assets.preload()
     window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
     try:
         if hasattr(window, "maximize"):
@@ -12,9 +83,18 @@ def main():
             window._window.set_maximized(True)
     except Exception:
         pass
-    app = AppContext()
-    window.show_view(MainMenuView(app))
-    arcade.run()
+    try:
+        app = AppContext(
+            seed=args.seed,
+            record_path=args.record,
+            replay=replay,
+            replay_speed=args.replay_speed,
+            autopilot=args.autopilot,
+        )
+        window.show_view(MainMenuView(app))
+        arcade.run()
+    finally:
+        storage.close()
 
 
 if __name__ == "__main__":
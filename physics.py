@@ -1,35 +1,78 @@
+from dataclasses import dataclass, field
+from typing import Protocol
+
 import config
 
 
+@dataclass(frozen=True)
+class PhysicsParams:
+    """Per-world physics and scroll values.
+
+    Worlds never mutate the config module. They swap in a new instance
+    (dataclasses.replace) when a rule, event, powerup, level or the
+    difficulty ramp changes one of these. Hot loops read `scroll_speed`
+    instead of multiplying config globals every frame.
+    """
+
+    gravity: float = config.GRAVITY
+    obstacle_speed: float = config.OBSTACLE_SPEED
+    speed_multiplier: float = config.GAME_SPEED_MULTIPLIER
+    jump_multiplier: float = 1.0
+    max_jump_height: float = config.MAX_JUMP_HEIGHT
+    scroll_speed: float = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "scroll_speed", self.obstacle_speed * self.speed_multiplier
+        )
+
+
+class JumpBody(Protocol):
+    """What PhysicsEngine drives. Dino implements it."""
+
+    velocity_y: float
+    center_y: float
+    bottom: float
+    on_ground: bool
+    jump_count: int
+    jump_buffer_left: float
+    coyote_time_left: float
+
+    def try_consume_jump(self) -> None: ...
+
+
 class PhysicsEngine:
-    def __init__(self, dino):
+    """Vertical integration for one JumpBody.
+
+    Config constants and the body's jump hook are bound at construction,
+    so update() is a straight-line step with no per-frame probing.
+    """
+
+    def __init__(self, dino: JumpBody):
         self.dino = dino
+        self.consume_jump = dino.try_consume_jump
+        self.air_drag = config.AIR_DRAG
+        self.terminal_velocity = config.TERMINAL_VELOCITY
+        self.ground_y = config.GROUND_Y
+        self.coyote_time = config.COYOTE_TIME
+
+    def update(self, delta_time: float, params: PhysicsParams) -> None:
+        dino = self.dino
+        dino.jump_buffer_left = max(dino.jump_buffer_left - delta_time, 0.0)
+        dino.coyote_time_left = max(dino.coyote_time_left - delta_time, 0.0)
+
+        velocity = dino.velocity_y - params.gravity * delta_time
+        if velocity < 0:
+            velocity += -velocity * self.air_drag * delta_time
+        if velocity < -self.terminal_velocity:
+            velocity = -self.terminal_velocity
+        dino.velocity_y = velocity
+        dino.center_y += velocity * delta_time
 
-    def update(self, delta_time: float) -> None:
-        if hasattr(self.dino, "jump_buffer_left"):
-            self.dino.jump_buffer_left = max(
-                self.dino.jump_buffer_left - delta_time, 0.0
-            )
-        if hasattr(self.dino, "coyote_time_left"):
-            self.dino.coyote_time_left = max(
-                self.dino.coyote_time_left - delta_time, 0.0
-            )
-        self.dino.velocity_y -= config.GRAVITY * delta_time
-        if self.dino.velocity_y < 0:
-            self.dino.velocity_y += (
-                -self.dino.velocity_y * config.AIR_DRAG * delta_time
-            )
-        if self.dino.velocity_y < -config.TERMINAL_VELOCITY:
-            self.dino.velocity_y = -config.TERMINAL_VELOCITY
-        self.dino.center_y += self.dino.velocity_y * delta_time
-
-        if self.dino.bottom <= config.GROUND_Y:
-            self.dino.bottom = config.GROUND_Y
-            self.dino.velocity_y = 0
-            self.dino.on_ground = True
-            if hasattr(self.dino, "jump_count"):
-                self.dino.jump_count = 0
-            if hasattr(self.dino, "coyote_time_left"):
-                self.dino.coyote_time_left = config.COYOTE_TIME
-        if hasattr(self.dino, "try_consume_jump"):
-            self.dino.try_consume_jump()
+        if dino.bottom <= self.ground_y:
+            dino.bottom = self.ground_y
+            dino.velocity_y = 0
+            dino.on_ground = True
+            dino.jump_count = 0
+            dino.coyote_time_left = self.coyote_time
+        self.consume_jump()
@@ -16,11 +16,13 @@ class RuleManager:
         interval: float,
         combo_rules: Optional[List[Rule]] = None,
         combo_chance: float = 0.0,
+        rng: Optional[random.Random] = None,
     ):
         self.rules = rules
         self.interval = interval
         self.combo_rules = combo_rules or []
         self.combo_chance = combo_chance
+        self.rng = rng if rng is not None else random.Random()
 
         self.timer = 0.0
         self.index = 0
@@ -52,11 +54,11 @@ class RuleManager:
         use_combo = (
             self.combo_rules
             and self.combo_chance > 0
-            and random.random() < self.combo_chance
+            and self.rng.random() < self.combo_chance
         )
 
         if use_combo:
-            self.current_rule = random.choice(self.combo_rules)
+            self.current_rule = self.rng.choice(self.combo_rules)
             self.current_rule.apply()
             return True
 
@@ -0,0 +1,111 @@
+from typing import Dict, Tuple
+
+import config
+from jump_arcs import JumpTable
+
+
+MAX_SPAWN_ATTEMPTS = 4
+BIRD_HEIGHT = 30
+BIRD_WIDTH = 50
+CACTUS_SPACING = int(config.OBSTACLE_WIDTH * 0.8 + 6)
+
+Candidate = Tuple[str, object]  # ("bird", "low"/"high") or ("cactus", group size)
+
+
+def cactus_group_width(group_size: int) -> float:
+    return (group_size - 1) * CACTUS_SPACING + config.OBSTACLE_WIDTH
+
+
+class ObstacleSpawner:
+    """Picks the next obstacle and rejects ones the dino could not clear.
+
+    Each candidate is checked against the current jump table and scroll
+    speed: cactus groups must be jumpable, low birds must be duckable or
+    jumpable, and two obstacles that need an action must be at least
+    SAFE_SPAWN_GAP (or one full jump's air time) apart. Rejected candidates
+    are resampled at most MAX_SPAWN_ATTEMPTS times, then a single cactus or
+    high bird is used, so every spawn costs a bounded number of O(1) checks.
+    """
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.last_tag = None
+        self.last_needs_action = False
+        self.stats: Dict[str, int] = {
+            "spawns": 0,
+            "rejected_unclearable": 0,
+            "rejected_gap": 0,
+            "fallbacks": 0,
+        }
+
+    def sample(self, bird_chance: float) -> Candidate:
+        spawn_bird = self.rng.random() < bird_chance
+
+        if spawn_bird:
+            height_type = self.rng.choice(["low", "high"])
+            if self.last_tag == "bird_low" and height_type == "low":
+                height_type = "high"
+            return "bird", height_type
+
+        roll = self.rng.random()
+        if roll < 0.6:
+            group_size = 1
+        elif roll < 0.85:
+            group_size = 2
+        else:
+            group_size = 3
+        return "cactus", group_size
+
+    @staticmethod
+    def needs_action(candidate: Candidate) -> bool:
+        return candidate != ("bird", "high")
+
+    @staticmethod
+    def is_clearable(candidate: Candidate, jump_table: JumpTable, speed: float) -> bool:
+        kind, arg = candidate
+        arc = jump_table.full
+        if kind == "cactus":
+            return arc.can_clear(config.OBSTACLE_HEIGHT, cactus_group_width(arg), speed)
+        if arg == "high":
+            return True
+        bird_bottom = config.BIRD_HEIGHT_LOW - BIRD_HEIGHT / 2
+        if config.GROUND_Y + config.DINO_CROUCH_HEIGHT < bird_bottom:
+            return True
+        bird_top = config.BIRD_HEIGHT_LOW + BIRD_HEIGHT / 2
+        return arc.can_clear(bird_top - config.GROUND_Y, BIRD_WIDTH, speed)
+
+    def choose(
+        self,
+        bird_chance: float,
+        jump_table: JumpTable,
+        speed: float,
+        since_last: float,
+    ) -> Candidate:
+        min_gap = max(config.SAFE_SPAWN_GAP, jump_table.full.air_time)
+        gap_ok = not self.last_needs_action or since_last >= min_gap
+
+        candidate = None
+        for _ in range(MAX_SPAWN_ATTEMPTS):
+            option = self.sample(bird_chance)
+            if not gap_ok and self.needs_action(option):
+                self.stats["rejected_gap"] += 1
+                continue
+            if not self.is_clearable(option, jump_table, speed):
+                self.stats["rejected_unclearable"] += 1
+                continue
+            candidate = option
+            break
+
+        if candidate is None:
+            self.stats["fallbacks"] += 1
+            single = ("cactus", 1)
+            if gap_ok and self.is_clearable(single, jump_table, speed):
+                candidate = single
+            else:
+                candidate = ("bird", "high")
+
+        kind, arg = candidate
+        self.last_tag = f"bird_{arg}" if kind == "bird" else f"cactus_{arg}"
+        self.last_needs_action = self.needs_action(candidate)
+        self.stats["spawns"] += 1
+        return candidate
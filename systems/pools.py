@@ -0,0 +1,50 @@
+from typing import Generic, List, Type, TypeVar
+
+import arcade
+
+
+SpriteType = TypeVar("SpriteType", bound=arcade.Sprite)
+
+
+class SpritePool(Generic[SpriteType]):
+    """Free list of sprites of one class.
+
+    The class's constructor and its `reset` method take the same spawn
+    arguments, so `acquire(*args)` either resets a released sprite or
+    builds a new one. Pooled sprites carry a `pool` attribute, so whoever
+    despawns one can hand it back with `sprite.pool.release(sprite)`.
+    """
+
+    def __init__(self, cls: Type[SpriteType]):
+        self.cls = cls
+        self.free: List[SpriteType] = []
+        self.capacity = 0  # sprites ever created
+        self.in_use = 0
+        self.high_water = 0
+
+    def acquire(self, *args, **kwargs) -> SpriteType:
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args, **kwargs)
+        else:
+            sprite = self.cls(*args, **kwargs)
+            sprite.pool = self
+            self.capacity += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return sprite
+
+    def release(self, sprite: SpriteType) -> None:
+        sprite.remove_from_sprite_lists()
+        self.free.append(sprite)
+        self.in_use -= 1
+
+
+def release(sprite: arcade.Sprite) -> None:
+    """Return a sprite to its pool, or just unlist it if it was never pooled."""
+    pool = getattr(sprite, "pool", None)
+    if pool is None:
+        sprite.remove_from_sprite_lists()
+    else:
+        pool.release(sprite)
@@ -0,0 +1,212 @@
+import struct
+from dataclasses import dataclass, field
+from typing import FrozenSet, List, Optional, Tuple
+
+import config
+from world import World, WorldSettings
+
+
+MAGIC = b"DRPL"
+VERSION = 2
+CODE_BITS = 4
+SETTING_FLAGS = (
+    "enable_wind",
+    "enable_day_night",
+    "enable_events",
+    "enable_meteors",
+    "enable_golden",
+)
+# magic, version, tick rate, settings bitmask; then the seed as a zigzag
+# varint, so any int seed round-trips
+HEADER = struct.Struct("<4sBHB")
+# version 1 stored the seed as an unsigned 64-bit field instead
+HEADER_V1 = struct.Struct("<4sBHQB")
+SCORE = struct.Struct("<d")
+
+
+class ReplayError(ValueError):
+    pass
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("truncated replay")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+@dataclass
+class Replay:
+    """Seed, world settings and the timestamped input stream of one run.
+
+    Inputs are (tick, code) pairs where tick is the number of fixed
+    simulation steps taken before the input was applied.
+    """
+
+    seed: int
+    tick_rate: int = config.SIMULATION_TICK_RATE
+    settings: WorldSettings = field(default_factory=WorldSettings)
+    owned: FrozenSet[str] = frozenset()
+    inputs: List[Tuple[int, int]] = field(default_factory=list)
+    end_tick: int = 0
+    score: float = 0.0
+
+    def to_bytes(self) -> bytes:
+        flags = 0
+        for bit, name in enumerate(SETTING_FLAGS):
+            if getattr(self.settings, name):
+                flags |= 1 << bit
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.tick_rate, flags))
+        _write_varint(out, _zigzag(self.seed))
+
+        owned = ",".join(sorted(self.owned)).encode("utf-8")
+        _write_varint(out, len(owned))
+        out += owned
+
+        # Inputs are delta-encoded: ticks since the previous input, with the
+        # input code packed into the low bits of the same varint.
+        _write_varint(out, len(self.inputs))
+        last_tick = 0
+        for tick, code in self.inputs:
+            _write_varint(out, ((tick - last_tick) << CODE_BITS) | code)
+            last_tick = tick
+
+        _write_varint(out, self.end_tick - last_tick)
+        out += SCORE.pack(self.score)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if len(data) < HEADER.size:
+            raise ReplayError("truncated replay")
+        magic, version = data[:4], data[4]
+        if magic != MAGIC:
+            raise ReplayError("not a replay file")
+        if version == VERSION:
+            _, _, tick_rate, flags = HEADER.unpack_from(data)
+            seed, pos = _read_varint(data, HEADER.size)
+            seed = _unzigzag(seed)
+        elif version == 1:
+            if len(data) < HEADER_V1.size:
+                raise ReplayError("truncated replay")
+            _, _, tick_rate, seed, flags = HEADER_V1.unpack_from(data)
+            pos = HEADER_V1.size
+        else:
+            raise ReplayError(f"unsupported replay version {version}")
+        settings = WorldSettings(
+            **{name: bool(flags & (1 << bit)) for bit, name in enumerate(SETTING_FLAGS)}
+        )
+
+        length, pos = _read_varint(data, pos)
+        owned_text = data[pos:pos + length].decode("utf-8")
+        pos += length
+        owned = frozenset(item for item in owned_text.split(",") if item)
+
+        count, pos = _read_varint(data, pos)
+        inputs = []
+        tick = 0
+        mask = (1 << CODE_BITS) - 1
+        for _ in range(count):
+            value, pos = _read_varint(data, pos)
+            tick += value >> CODE_BITS
+            inputs.append((tick, value & mask))
+
+        delta, pos = _read_varint(data, pos)
+        if pos + SCORE.size > len(data):
+            raise ReplayError("truncated replay")
+        (score,) = SCORE.unpack_from(data, pos)
+        return cls(
+            seed=seed,
+            tick_rate=tick_rate,
+            settings=settings,
+            owned=owned,
+            inputs=inputs,
+            end_tick=tick + delta,
+            score=score,
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def make_world(self) -> World:
+        return World(settings=self.settings, owned=self.owned, seed=self.seed)
+
+
+class ReplayRecorder:
+    def __init__(self, world: World, tick_rate: int = config.SIMULATION_TICK_RATE):
+        self.world = world
+        settings = WorldSettings(
+            **{name: bool(getattr(world.settings, name)) for name in SETTING_FLAGS}
+        )
+        self.replay = Replay(
+            seed=world.rng.seed,
+            tick_rate=tick_rate,
+            settings=settings,
+            owned=frozenset(world.owned),
+        )
+
+    def record(self, code: int) -> None:
+        self.replay.inputs.append((self.world.tick, code))
+
+    def finish(self) -> Replay:
+        self.replay.end_tick = self.world.tick
+        self.replay.score = self.world.score
+        return self.replay
+
+
+class ReplayPlayer:
+    """Feeds a replay's inputs into a World as it reaches each tick."""
+
+    def __init__(self, replay: Replay, world: Optional[World] = None):
+        self.replay = replay
+        self.world = world if world is not None else replay.make_world()
+        self.index = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.world.game_over or self.world.tick >= self.replay.end_tick
+
+    def feed(self) -> None:
+        inputs = self.replay.inputs
+        tick = self.world.tick
+        while self.index < len(inputs) and inputs[self.index][0] <= tick:
+            self.world.apply_input(inputs[self.index][1])
+            self.index += 1
+
+    def step(self) -> None:
+        self.feed()
+        self.world.step(1.0 / self.replay.tick_rate)
+
+    def run(self) -> World:
+        """Play the whole replay headless, as fast as possible."""
+        while not self.finished:
+            self.step()
+        return self.world
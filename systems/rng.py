@@ -0,0 +1,32 @@
+import random
+from typing import Dict, Optional
+
+
+def new_seed() -> int:
+    return random.SystemRandom().randrange(2**32)
+
+
+class RandomStreams:
+    """One random.Random per subsystem, all derived from a single seed.
+
+    Each stream is seeded from (seed, name), so drawing more numbers in one
+    subsystem (e.g. cosmetic particles) never shifts the sequence another
+    subsystem sees.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = new_seed() if seed is None else seed
+        self._streams: Dict[str, random.Random] = {}
+        self.obstacles = self.stream("obstacles")
+        self.pickups = self.stream("pickups")
+        self.events = self.stream("events")
+        self.wind = self.stream("wind")
+        self.rules = self.stream("rules")
+        self.particles = self.stream("particles")
+
+    def stream(self, name: str) -> random.Random:
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = random.Random(f"{self.seed}:{name}")
+            self._streams[name] = rng
+        return rng
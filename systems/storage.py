@@ -1,101 +1,491 @@
+import atexit
+import bisect
 import sqlite3
-from typing import Dict
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 
 DB_PATH = "arcade_stats.db"
+SCHEMA_VERSION = 2
+RETRY_DELAY = 0.5  # seconds before retrying a batch sqlite refused
 
 
-def _connect() -> sqlite3.Connection:
-    return sqlite3.connect(DB_PATH)
+class ConnectionManager:
+    """One long-lived connection to DB_PATH shared by every storage call.
 
+    The connection runs in WAL mode with synchronous=NORMAL, so a commit is an
+    append to the log instead of a full fsync. sqlite3 keeps compiled
+    statements per connection, so the fixed SQL strings below are prepared
+    once and reused. Access is serialized with a lock, which makes the
+    manager safe to use from more than one thread.
+    """
 
-def init_db() -> None:
-    with _connect() as conn:
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.conn: Optional[sqlite3.Connection] = None
+        self.path: Optional[str] = None
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.lock:
+            if self.conn is None or self.path != DB_PATH:
+                self.close()
+                self.conn = self._open()
+                self.path = DB_PATH
+            try:
+                yield self.conn
+            except Exception:
+                self.conn.rollback()
+                raise
+            else:
+                self.conn.commit()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+                self.path = None
+
+
+_db = ConnectionManager()
+
+
+def _connect():
+    return _db.transaction()
+
+
+def _empty_stats() -> Dict[str, float]:
+    return {
+        "total_runs": 0,
+        "total_coins": 0,
+        "best_score": 0,
+        "best_coins": 0,
+        "coins_balance": 0,
+    }
+
+
+def _stats_from_row(row) -> Dict[str, float]:
+    if not row:
+        return _empty_stats()
+    return {
+        "total_runs": int(row[0]),
+        "total_coins": int(row[1]),
+        "best_score": float(row[2]),
+        "best_coins": int(row[3]),
+        "coins_balance": int(row[4]),
+    }
+
+
+class StorageCache:
+    """Authoritative in-memory copy of the stats row, purchases and settings.
+
+    Filled from the database on first use. Writes patch this copy right away
+    and hand the matching SQL to the background writer.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self.stats: Dict[str, float] = _empty_stats()
+        self.owned: Set[str] = set()
+        self.settings: Dict[str, str] = {}
+        self.run_scores: Optional[List[float]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> "StorageCache":
+        if self.loaded:
+            return self
+        with _connect() as conn:
+            self.fill(conn)
+        return self
+
+    def fill(self, conn: sqlite3.Connection) -> None:
         cur = conn.cursor()
         cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS stats (
-                id INTEGER PRIMARY KEY CHECK (id = 1),
-                total_runs INTEGER NOT NULL,
-                total_coins INTEGER NOT NULL,
-                best_score REAL NOT NULL,
-                best_coins INTEGER NOT NULL,
-                coins_balance INTEGER NOT NULL
-            )
-            """
-        )
-        cur.execute(
-            """
-            INSERT OR IGNORE INTO stats
-            (id, total_runs, total_coins, best_score, best_coins, coins_balance)
-            VALUES (1, 0, 0, 0, 0, 0)
-            """
+            "SELECT total_runs, total_coins, best_score, best_coins, coins_balance "
+            "FROM stats WHERE id = 1"
         )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS purchases (
-                item_id TEXT PRIMARY KEY
+        self.stats = _stats_from_row(cur.fetchone())
+        cur.execute("SELECT item_id FROM purchases")
+        self.owned = {row[0] for row in cur.fetchall()}
+        cur.execute("SELECT key, value FROM settings")
+        self.settings = dict(cur.fetchall())
+        self.loaded = True
+
+    def read(self) -> "StorageCache":
+        if self.loaded:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return self.load()
+
+    def sorted_run_scores(self) -> List[float]:
+        if self.run_scores is None:
+            _writer.flush()
+            with _connect() as conn:
+                cur = conn.execute("SELECT score FROM runs ORDER BY score")
+                self.run_scores = [row[0] for row in cur.fetchall()]
+        return self.run_scores
+
+    def invalidate(self) -> None:
+        _writer.flush()
+        self.loaded = False
+        self.run_scores = None
+
+
+Statement = Tuple[str, tuple]
+
+
+class BackgroundWriter:
+    """Commits queued writes on a worker thread, off the render loop.
+
+    Writes are keyed: a newer write with the same key replaces the pending
+    one (settings by key, the stats row as a whole), so bursts collapse into
+    a single statement. Appended rows are grouped per statement and inserted
+    with executemany. Everything pending is committed in one transaction.
+    A batch that fails is put back in the queue and retried after
+    RETRY_DELAY; `last_error` keeps the exception.
+    """
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.pending: "OrderedDict[object, List[Statement]]" = OrderedDict()
+        self.appends: "OrderedDict[str, List[tuple]]" = OrderedDict()
+        self.busy = False
+        self.stopping = False
+        self.thread: Optional[threading.Thread] = None
+        self.next_id = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_error: Optional[sqlite3.Error] = None
+        self.generation = 0
+
+    def submit(self, key, statements: List[Statement]) -> None:
+        with self.cond:
+            if key is None:
+                key = ("op", self.next_id)
+                self.next_id += 1
+            self.pending.pop(key, None)
+            self.pending[key] = statements
+            self._wake()
+
+    def append(self, sql: str, row: tuple) -> None:
+        with self.cond:
+            self.appends.setdefault(sql, []).append(row)
+            self._wake()
+
+    def _wake(self) -> None:
+        if self.thread is None or not self.thread.is_alive():
+            self.stopping = False
+            self.thread = threading.Thread(
+                target=self._run, name="storage-writer", daemon=True
             )
-            """
+            self.thread.start()
+        self.cond.notify_all()
+
+    def has_work(self) -> bool:
+        return bool(self.pending or self.appends)
+
+    def discard_pending(self) -> None:
+        with self.cond:
+            self.pending.clear()
+            self.appends.clear()
+            self.generation += 1
+
+    def _requeue(self, batch, appends) -> None:
+        # Put a failed batch back ahead of anything queued since; a newer
+        # write with the same key still replaces it.
+        pending = OrderedDict(
+            (key, statements) for key, statements in batch if key not in self.pending
         )
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT NOT NULL
+        pending.update(self.pending)
+        self.pending = pending
+        merged = OrderedDict(appends)
+        for sql, rows in self.appends.items():
+            merged.setdefault(sql, []).extend(rows)
+        self.appends = merged
+
+    def _run(self) -> None:
+        failed = False
+        while True:
+            with self.cond:
+                if failed and not self.stopping:
+                    self.cond.wait(RETRY_DELAY)
+                while not self.has_work() and not self.stopping:
+                    self.cond.wait()
+                if not self.has_work() or (failed and self.stopping):
+                    return
+                batch = list(self.pending.items())
+                appends = list(self.appends.items())
+                generation = self.generation
+                self.pending.clear()
+                self.appends.clear()
+                self.busy = True
+            try:
+                with _connect() as conn:
+                    for _, statements in batch:
+                        for sql, params in statements:
+                            conn.execute(sql, params)
+                    for sql, rows in appends:
+                        conn.executemany(sql, rows)
+                self.batches += 1
+                failed = False
+            except sqlite3.Error as exc:
+                failed = True
+                with self.cond:
+                    self.errors += 1
+                    self.last_error = exc
+                    if generation == self.generation:
+                        self._requeue(batch, appends)
+            finally:
+                with self.cond:
+                    self.busy = False
+                    self.cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every submitted write is committed.
+
+        Returns False on timeout, or as soon as a commit fails; the failed
+        writes stay queued for the retry.
+        """
+        with self.cond:
+            errors = self.errors
+            self.cond.wait_for(
+                lambda: self.errors != errors
+                or not (self.has_work() or self.busy),
+                timeout,
             )
-            """
+            return not (self.has_work() or self.busy)
+
+    def stop(self) -> None:
+        with self.cond:
+            self.stopping = True
+            self.cond.notify_all()
+            thread = self.thread
+        if thread is not None:
+            thread.join()
+        self.thread = None
+
+
+_cache = StorageCache()
+_writer = BackgroundWriter()
+
+
+def get_cache_stats() -> Dict[str, int]:
+    return {"hits": _cache.hits, "misses": _cache.misses}
+
+
+def invalidate_cache() -> None:
+    _cache.invalidate()
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    return _writer.flush(timeout)
+
+
+def close() -> None:
+    _writer.stop()
+    _db.close()
+
+
+atexit.register(close)
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    cur = conn.cursor()
+    cur.execute("PRAGMA user_version")
+    if cur.fetchone()[0] == SCHEMA_VERSION:
+        return
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_runs INTEGER NOT NULL,
+            total_coins INTEGER NOT NULL,
+            best_score REAL NOT NULL,
+            best_coins INTEGER NOT NULL,
+            coins_balance INTEGER NOT NULL
+        )
+        """
+    )
+    cur.execute(
+        """
+        INSERT OR IGNORE INTO stats
+        (id, total_runs, total_coins, best_score, best_coins, coins_balance)
+        VALUES (1, 0, 0, 0, 0, 0)
+        """
+    )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS purchases (
+            item_id TEXT PRIMARY KEY
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """
+    )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            score REAL NOT NULL,
+            coins INTEGER NOT NULL,
+            duration REAL NOT NULL,
+            level INTEGER NOT NULL,
+            rule TEXT,
+            created_at REAL NOT NULL
         )
-        conn.commit()
+        """
+    )
+    cur.execute("CREATE INDEX IF NOT EXISTS runs_score_idx ON runs (score DESC)")
+    cur.execute("CREATE INDEX IF NOT EXISTS runs_time_idx ON runs (created_at)")
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def init_db() -> None:
+    _writer.flush()
+    with _connect() as conn:
+        _ensure_schema(conn)
+    _cache.invalidate()
+
+
+def load_snapshot() -> Dict[str, object]:
+    """Schema check plus stats, settings and owned items in one transaction."""
+    _writer.flush()
+    with _connect() as conn:
+        _ensure_schema(conn)
+        _cache.fill(conn)
+    _cache.run_scores = None
+    _cache.misses += 1
+    return {
+        "stats": dict(_cache.stats),
+        "settings": dict(_cache.settings),
+        "owned": set(_cache.owned),
+    }
+
+
+def _save_stats(stats: Dict[str, float]) -> None:
+    _writer.submit(
+        "stats",
+        [
+            (
+                """
+                UPDATE stats
+                SET total_runs = ?, total_coins = ?, best_score = ?, best_coins = ?, coins_balance = ?
+                WHERE id = 1
+                """,
+                (
+                    stats["total_runs"],
+                    stats["total_coins"],
+                    stats["best_score"],
+                    stats["best_coins"],
+                    stats["coins_balance"],
+                ),
+            )
+        ],
+    )
 
 
 def get_stats() -> Dict[str, float]:
+    return dict(_cache.read().stats)
+
+
+INSERT_RUN_SQL = (
+    "INSERT INTO runs (score, coins, duration, level, rule, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+RUN_COLUMNS = "score, coins, duration, level, rule, created_at"
+
+
+def record_run(
+    score: float,
+    coins: int,
+    duration: float = 0.0,
+    level: int = 1,
+    rule: Optional[str] = None,
+) -> None:
+    cache = _cache.load()
+    stats = cache.stats
+    stats["total_runs"] += 1
+    stats["total_coins"] += coins
+    stats["coins_balance"] += coins
+    stats["best_score"] = max(stats["best_score"], float(score))
+    stats["best_coins"] = max(stats["best_coins"], coins)
+    _save_stats(stats)
+
+    _writer.append(
+        INSERT_RUN_SQL,
+        (float(score), int(coins), float(duration), int(level), rule, time.time()),
+    )
+    if cache.run_scores is not None:
+        bisect.insort(cache.run_scores, float(score))
+
+
+def _run_from_row(row) -> Dict[str, Union[float, int, str, None]]:
+    return {
+        "score": float(row[0]),
+        "coins": int(row[1]),
+        "duration": float(row[2]),
+        "level": int(row[3]),
+        "rule": row[4],
+        "created_at": float(row[5]),
+    }
+
+
+def get_top_runs(limit: int = 10) -> List[Dict[str, Union[float, int, str, None]]]:
+    _writer.flush()
     with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT total_runs, total_coins, best_score, best_coins, coins_balance "
-            "FROM stats WHERE id = 1"
+        cur = conn.execute(
+            f"SELECT {RUN_COLUMNS} FROM runs ORDER BY score DESC LIMIT ?", (limit,)
         )
-        row = cur.fetchone()
-        if not row:
-            return {
-                "total_runs": 0,
-                "total_coins": 0,
-                "best_score": 0,
-                "best_coins": 0,
-                "coins_balance": 0,
-            }
-        return {
-            "total_runs": int(row[0]),
-            "total_coins": int(row[1]),
-            "best_score": float(row[2]),
-            "best_coins": int(row[3]),
-            "coins_balance": int(row[4]),
-        }
-
-
-def record_run(score: float, coins: int) -> None:
+        return [_run_from_row(row) for row in cur.fetchall()]
+
+
+def get_recent_runs(limit: int = 10) -> List[Dict[str, Union[float, int, str, None]]]:
+    _writer.flush()
     with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT total_runs, total_coins, best_score, best_coins, coins_balance "
-            "FROM stats WHERE id = 1"
-        )
-        total_runs, total_coins, best_score, best_coins, coins_balance = cur.fetchone()
-        total_runs += 1
-        total_coins += coins
-        coins_balance += coins
-        best_score = max(best_score, score)
-        best_coins = max(best_coins, coins)
-        cur.execute(
-            """
-            UPDATE stats
-            SET total_runs = ?, total_coins = ?, best_score = ?, best_coins = ?, coins_balance = ?
-            WHERE id = 1
-            """,
-            (total_runs, total_coins, best_score, best_coins, coins_balance),
+        cur = conn.execute(
+            f"SELECT {RUN_COLUMNS} FROM runs ORDER BY created_at DESC LIMIT ?",
+            (limit,),
         )
-        conn.commit()
+        return [_run_from_row(row) for row in cur.fetchall()]
+
+
+def get_run_count() -> int:
+    return len(_cache.sorted_run_scores())
+
+
+def get_score_percentile(score: float) -> float:
+    """Share of recorded runs (0-100) that scored strictly below `score`."""
+    scores = _cache.sorted_run_scores()
+    if not scores:
+        return 0.0
+    return 100.0 * bisect.bisect_left(scores, score) / len(scores)
+
+
+def get_percentile_score(percentile: float) -> float:
+    """Score at the given percentile (0-100) of all recorded runs."""
+    scores = _cache.sorted_run_scores()
+    if not scores:
+        return 0.0
+    index = int(round(percentile / 100.0 * (len(scores) - 1)))
+    return scores[max(0, min(index, len(scores) - 1))]
 
 
 def get_coins_balance() -> int:
@@ -103,84 +493,81 @@ def get_coins_balance() -> int:
 
 
 def purchase(item_id: str, cost: int) -> bool:
-    with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT item_id FROM purchases WHERE item_id = ?", (item_id,))
-        if cur.fetchone():
-            return False
-
-        cur.execute("SELECT coins_balance FROM stats WHERE id = 1")
-        balance = cur.fetchone()[0]
-        if balance < cost:
-            return False
+    cache = _cache.load()
+    if item_id in cache.owned:
+        return False
+    if cache.stats["coins_balance"] < cost:
+        return False
 
-        balance -= cost
-        cur.execute("UPDATE stats SET coins_balance = ? WHERE id = 1", (balance,))
-        cur.execute("INSERT INTO purchases (item_id) VALUES (?)", (item_id,))
-        conn.commit()
-        return True
+    cache.stats["coins_balance"] -= cost
+    cache.owned.add(item_id)
+    _save_stats(cache.stats)
+    _writer.submit(
+        ("purchase", item_id),
+        [("INSERT OR IGNORE INTO purchases (item_id) VALUES (?)", (item_id,))],
+    )
+    return True
 
 
 def is_owned(item_id: str) -> bool:
-    with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT item_id FROM purchases WHERE item_id = ?", (item_id,))
-        return cur.fetchone() is not None
+    return item_id in _cache.read().owned
+
+
+def get_owned_items() -> Set[str]:
+    return set(_cache.read().owned)
 
 
 def get_setting(key: str, default: str) -> str:
-    with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = cur.fetchone()
-        return row[0] if row else default
+    return _cache.read().settings.get(key, default)
 
 
 def set_setting(key: str, value: str) -> None:
-    with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO settings (key, value) VALUES (?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            (key, value),
-        )
-        conn.commit()
+    _cache.load().settings[key] = value
+    _writer.submit(
+        ("setting", key),
+        [
+            (
+                "INSERT INTO settings (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+        ],
+    )
 
 
 def add_coins(amount: int) -> None:
     if amount <= 0:
         return
-    with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE stats SET coins_balance = coins_balance + ? WHERE id = 1",
-            (amount,),
-        )
-        conn.commit()
+    stats = _cache.load().stats
+    stats["coins_balance"] += amount
+    _save_stats(stats)
 
 
 def unlock_items(item_ids) -> None:
     if not item_ids:
         return
-    with _connect() as conn:
-        cur = conn.cursor()
-        for item_id in item_ids:
-            cur.execute(
-                "INSERT OR IGNORE INTO purchases (item_id) VALUES (?)", (item_id,)
-            )
-        conn.commit()
+    cache = _cache.load()
+    for item_id in item_ids:
+        cache.owned.add(item_id)
+        _writer.submit(
+            ("purchase", item_id),
+            [("INSERT OR IGNORE INTO purchases (item_id) VALUES (?)", (item_id,))],
+        )
 
 
 def reset_all() -> None:
-    with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            UPDATE stats
-            SET total_runs = 0, total_coins = 0, best_score = 0, best_coins = 0, coins_balance = 0
-            WHERE id = 1
-            """
-        )
-        cur.execute("DELETE FROM purchases")
-        cur.execute("DELETE FROM settings")
-        conn.commit()
+    cache = _cache.load()
+    cache.stats = _empty_stats()
+    cache.owned.clear()
+    cache.settings.clear()
+    cache.run_scores = []
+    _writer.discard_pending()
+    _writer.submit(
+        None,
+        [
+            ("DELETE FROM purchases", ()),
+            ("DELETE FROM settings", ()),
+            ("DELETE FROM runs", ()),
+        ],
+    )
+    _save_stats(cache.stats)
@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+import pytest
+
+import config
+from batch_physics import BatchPhysicsEngine
+from entities.dino import Dino
+from physics import PhysicsEngine, PhysicsParams
+
+GRAVITY_PRESETS = (config.GRAVITY_LOW, config.GRAVITY_NORMAL, config.GRAVITY_HIGH)
+STEP_TIMES = (1 / 120, 1 / 60, 1 / 30, 0.0123)
+
+
+def run_lockstep(count, steps, seed):
+    """Step `count` Dino/PhysicsEngine pairs and one batch with the same
+    random presses, early releases, step times and gravity switches, and
+    yield both after every step."""
+    rng = random.Random(seed)
+    dinos = [Dino(x=100) for _ in range(count)]
+    engines = [PhysicsEngine(dino) for dino in dinos]
+    batch = BatchPhysicsEngine(count)
+    for i, dino in enumerate(dinos):
+        # Half of them can double jump.
+        dino.max_jumps = 1 + i % 2
+        batch.max_jumps[i] = dino.max_jumps
+
+    params = PhysicsParams()
+    for step in range(steps):
+        if step % 150 == 0:
+            params = PhysicsParams(gravity=rng.choice(GRAVITY_PRESETS))
+        press = np.array([rng.random() < 0.04 for _ in range(count)])
+        release = np.array([rng.random() < 0.05 for _ in range(count)])
+        velocity = config.DINO_JUMP_VELOCITY * rng.uniform(0.8, 1.2)
+        for i, dino in enumerate(dinos):
+            if press[i]:
+                dino.request_jump(velocity)
+            if release[i]:
+                dino.cut_jump()
+        batch.request_jump(press, velocity)
+        batch.cut_jump(release)
+
+        dt = rng.choice(STEP_TIMES)
+        for engine in engines:
+            engine.update(dt, params)
+        batch.update(dt, params)
+        yield dinos, batch
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_batch_matches_single_engines(seed):
+    jumps = double_jumps = 0
+    for dinos, batch in run_lockstep(count=16, steps=1200, seed=seed):
+        np.testing.assert_allclose(
+            batch.center_y, [d.center_y for d in dinos], rtol=0, atol=1e-6
+        )
+        np.testing.assert_allclose(
+            batch.velocity_y, [d.velocity_y for d in dinos], rtol=0, atol=1e-6
+        )
+        np.testing.assert_allclose(
+            batch.jump_buffer_left, [d.jump_buffer_left for d in dinos], atol=1e-9
+        )
+        np.testing.assert_allclose(
+            batch.coyote_time_left, [d.coyote_time_left for d in dinos], atol=1e-9
+        )
+        assert batch.on_ground.tolist() == [d.on_ground for d in dinos]
+        assert batch.jump_count.tolist() == [d.jump_count for d in dinos]
+        jumps += sum(d.jump_count == 1 for d in dinos)
+        double_jumps += sum(d.jump_count == 2 for d in dinos)
+    # The schedule really exercised jumps and double jumps.
+    assert jumps and double_jumps
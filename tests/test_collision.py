@@ -0,0 +1,33 @@
+from collision import collide, insert_by_x
+from world import World
+
+
+def world_with_cactus_ahead(distance):
+    world = World(seed=1, particles=False)
+    world.collision_stats = {"tunneled": 0}
+    cactus = world.pools["cactus"].acquire()
+    cactus.center_x = world.dino.center_x + distance
+    insert_by_x(world.obstacle_list, cactus)
+    return world, cactus
+
+
+def test_large_step_does_not_tunnel_through_cactus():
+    # One 0.5 s step carries the dino ~150 px, well past a 30 px cactus.
+    world, cactus = world_with_cactus_ahead(60)
+    start = world.dino.center_x
+    world.step(0.5)
+    assert world.dino.center_x - start > 120
+    assert world.dino.left > cactus.right
+    assert world.game_over
+    assert world.collision_stats["tunneled"] == 1
+
+
+def test_sprite_without_prev_position_is_static():
+    world, cactus = world_with_cactus_ahead(60)
+    dino = world.dino
+    prev_positions = {dino: dino.position}
+    dino.center_x += 150
+    assert collide(dino, [cactus], prev_positions) == [cactus]
+    # Same sprite, never crossed: the dino stops short of it.
+    dino.center_x -= 140
+    assert collide(dino, [cactus], prev_positions) == []
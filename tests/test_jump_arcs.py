@@ -0,0 +1,38 @@
+import config
+import jump_arcs
+from world import World
+
+
+def test_table_follows_config_overrides(monkeypatch):
+    # tools/balance overrides config in reused worker processes.
+    before = jump_arcs.get_table(config.GRAVITY_NORMAL, 1.0)
+    monkeypatch.setattr(config, "JUMP_TIME_TO_APEX", config.JUMP_TIME_TO_APEX * 2)
+    after = jump_arcs.get_table(config.GRAVITY_NORMAL, 1.0)
+    assert after is not before
+    assert after.full.apex > before.full.apex * 3.5
+
+
+def test_world_plans_at_its_step_time():
+    world = World(seed=1, particles=False)
+    assert world.jump_table.dt == world.step_dt
+    world.step(1 / 60)
+    assert world.jump_table.dt == 1 / 60
+
+
+def test_cut_arc_releases_before_first_step():
+    gravity = config.GRAVITY_NORMAL
+    velocity = jump_arcs.jump_velocity(1.0)
+    dt = 1 / config.SIMULATION_TICK_RATE
+    released = jump_arcs.simulate_heights(gravity, velocity, dt, cut_after=0)
+    cut_velocity = velocity * config.JUMP_CUTOFF_MULT
+    assert released[1] == (cut_velocity - gravity * dt) * dt
+    table = jump_arcs.get_table(gravity, 1.0, dt)
+    assert table.arcs["cut"].heights == released
+
+
+def test_variable_step_times_keep_the_cache_bounded():
+    world = World(seed=2, particles=False)
+    for i in range(jump_arcs.MAX_TABLES * 3):
+        world.step(1 / 120 + i * 1e-6)
+        assert world.jump_table.dt == world.step_dt
+    assert len(jump_arcs._tables) <= jump_arcs.MAX_TABLES
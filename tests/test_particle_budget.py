@@ -0,0 +1,17 @@
+from entities.particle import ParticleBudget
+
+
+def test_hold_counts_down_wall_clock_time():
+    # 2 ms of CPU against a 1 ms target, frames 62.5 ms apart: the 0.5 s
+    # hold is real time, so the next shed is eight frames later, not 250.
+    budget = ParticleBudget(target_fps=1000, window=4)
+    frames = 0
+    while budget.level == 0:
+        budget.record_frame(0.002, 0.0625)
+        frames += 1
+    assert frames == 4
+    frames = 0
+    while budget.level == 1:
+        budget.record_frame(0.002, 0.0625)
+        frames += 1
+    assert frames == ParticleBudget.HOLD_TIME / 0.0625
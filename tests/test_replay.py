@@ -0,0 +1,27 @@
+import pytest
+
+from systems.replay import Replay, ReplayPlayer, ReplayRecorder
+from world import INPUT_JUMP_PRESS, INPUT_JUMP_RELEASE, World
+
+
+def record_run(seed, ticks=600):
+    world = World(seed=seed, particles=False)
+    recorder = ReplayRecorder(world)
+    for tick in range(ticks):
+        if tick % 90 == 0:
+            recorder.record(INPUT_JUMP_PRESS)
+            world.apply_input(INPUT_JUMP_PRESS)
+        elif tick % 90 == 20:
+            recorder.record(INPUT_JUMP_RELEASE)
+            world.apply_input(INPUT_JUMP_RELEASE)
+        world.step(1.0 / recorder.replay.tick_rate)
+    return world, recorder.finish()
+
+
+@pytest.mark.parametrize("seed", [-1, 0, 7, -(2**70), 2**64 + 5])
+def test_seed_round_trips(seed):
+    world, replay = record_run(seed)
+    loaded = Replay.from_bytes(replay.to_bytes())
+    assert loaded == replay
+    played = ReplayPlayer(loaded).run()
+    assert (played.tick, played.score) == (world.tick, world.score)
@@ -0,0 +1,41 @@
+import numpy as np
+
+import world as world_module
+from graphics.shapes import ShapeRenderer
+from world import World
+
+
+def assert_mirrors(renderer, world):
+    static = renderer.static
+    sprites = [
+        sprite
+        for sprite_list in (world.coin_list, world.powerup_list, world.obstacle_list)
+        for sprite in sprite_list
+    ]
+    assert set(static.slots) == set(sprites)
+    for sprite in sprites:
+        row = static.data[static.slots[sprite]]
+        np.testing.assert_allclose(row["position"], sprite.position)
+    for index in static.free:
+        assert static.data[index]["size"].tolist() == [0.0, 0.0]
+
+
+def test_static_rows_follow_spawns_despawns_and_rebase():
+    world = World(seed=4, particles=False)
+    renderer = ShapeRenderer()
+    renderer.attach(world)
+    # Survive everything, and cross a scroll rebase partway through.
+    world.shield_time_left = float("inf")
+    world.scroll = world_module.SCROLL_REBASE - 2000
+    world.dino.center_x += world.scroll
+    for tick in range(3000):
+        world.step(1 / 120)
+        world.shield_time_left = float("inf")
+        if tick % 100 == 0:
+            assert_mirrors(renderer, world)
+    assert world.scroll < world_module.SCROLL_REBASE
+    assert renderer.static.free
+    assert_mirrors(renderer, world)
+
+    world.restart(seed=5)
+    assert not renderer.static.slots
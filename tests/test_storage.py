@@ -0,0 +1,25 @@
+import sqlite3
+
+from systems import storage
+
+
+def test_failed_batch_is_kept_and_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DB_PATH", str(tmp_path / "stats.db"))
+    monkeypatch.setattr(storage, "RETRY_DELAY", 0.01)
+    writer = storage.BackgroundWriter()
+    try:
+        writer.append("INSERT INTO scores (score) VALUES (?)", (1.0,))
+        writer.submit("best", [("INSERT INTO scores (score) VALUES (?)", (2.0,))])
+        assert writer.flush(timeout=5) is False
+        assert writer.errors >= 1
+        assert isinstance(writer.last_error, sqlite3.OperationalError)
+
+        with storage._connect() as conn:
+            conn.execute("CREATE TABLE scores (score REAL)")
+        assert writer.flush(timeout=5) is True
+        with storage._connect() as conn:
+            rows = conn.execute("SELECT score FROM scores ORDER BY score").fetchall()
+        assert rows == [(1.0,), (2.0,)]
+    finally:
+        writer.stop()
+        storage._db.close()
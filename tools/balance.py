@@ -0,0 +1,161 @@
+"""Monte Carlo balancing: seeded headless runs per config parameter set.
+
+Every combination of the --param values is a parameter set. Each set is
+played --runs times by the autopilot with seeds --seed .. --seed+runs-1,
+spread over a process pool. One CSV row of survival statistics is written
+per set as soon as all of its runs finish.
+
+    python -m tools.balance --param SPAWN_INTERVAL_MIN=1.2,1.4,1.6 \\
+        --param RULE_COMBO_CHANCE=0.2,0.35 --runs 500 --out balance.csv
+"""
+import argparse
+import ast
+import csv
+import itertools
+import math
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import config
+from autopilot import Autopilot
+from world import World
+
+
+MAX_CHUNK_SIZE = 25
+_DEFAULTS = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+
+
+def parse_param(text):
+    name, _, values = text.partition("=")
+    name = name.strip()
+    if name not in _DEFAULTS:
+        raise argparse.ArgumentTypeError(f"unknown config value {name!r}")
+    if not values:
+        raise argparse.ArgumentTypeError(f"no values given for {name}")
+    return name, [ast.literal_eval(v.strip()) for v in values.split(",")]
+
+
+def run_chunk(overrides, seeds, tick_rate, max_time):
+    for name, value in _DEFAULTS.items():
+        setattr(config, name, value)
+    for name, value in overrides.items():
+        setattr(config, name, value)
+
+    step = 1.0 / tick_rate
+    max_ticks = int(max_time * tick_rate)
+    results = []
+    for seed in seeds:
+        world = World(seed=seed, particles=False)
+        pilot = Autopilot()
+        while not world.game_over and world.tick < max_ticks:
+            pilot.update(world)
+            world.step(step)
+        results.append((world.tick * step, world.score, world.game_over))
+    return results
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = (len(sorted_values) - 1) * pct / 100.0
+    low = math.floor(index)
+    high = math.ceil(index)
+    frac = index - low
+    return sorted_values[low] * (1 - frac) + sorted_values[high] * frac
+
+
+def summarize(results):
+    survival = sorted(r[0] for r in results)
+    scores = [r[1] for r in results]
+    return {
+        "runs": len(results),
+        "survival_mean": statistics.fmean(survival),
+        "survival_std": statistics.pstdev(survival),
+        "survival_p10": percentile(survival, 10),
+        "survival_p50": percentile(survival, 50),
+        "survival_p90": percentile(survival, 90),
+        "survival_max": survival[-1],
+        "score_mean": statistics.fmean(scores),
+        "timeouts": sum(1 for r in results if not r[2]),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--param",
+        type=parse_param,
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="config value to sweep; repeat to sweep a grid",
+    )
+    parser.add_argument("--runs", type=int, default=200, help="runs per parameter set")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    parser.add_argument("--max-time", type=float, default=300.0, help="run cap in seconds")
+    parser.add_argument("--tick-rate", type=int, default=config.SIMULATION_TICK_RATE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="-", help="CSV path, '-' for stdout")
+    args = parser.parse_args(argv)
+
+    names = [name for name, _ in args.param]
+    param_sets = [
+        dict(zip(names, values))
+        for values in itertools.product(*(values for _, values in args.param))
+    ]
+    seeds = list(range(args.seed, args.seed + args.runs))
+    # Small enough chunks to keep every worker busy until the end.
+    workers = args.workers or 1
+    chunk_size = max(
+        1,
+        min(MAX_CHUNK_SIZE, math.ceil(len(seeds) * len(param_sets) / (workers * 4))),
+    )
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="")
+    writer = None
+    started = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for index, overrides in enumerate(param_sets):
+                for chunk in chunks:
+                    future = pool.submit(
+                        run_chunk, overrides, chunk, args.tick_rate, args.max_time
+                    )
+                    futures[future] = index
+            pending = {index: len(chunks) for index in range(len(param_sets))}
+            collected = {index: [] for index in range(len(param_sets))}
+
+            for future in as_completed(futures):
+                index = futures[future]
+                collected[index].extend(future.result())
+                pending[index] -= 1
+                if pending[index]:
+                    continue
+                row = dict(param_sets[index])
+                row.update(summarize(collected.pop(index)))
+                if writer is None:
+                    writer = csv.DictWriter(out, fieldnames=list(row))
+                    writer.writeheader()
+                writer.writerow(row)
+                out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    total = len(param_sets) * len(seeds)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{total} runs in {elapsed:.1f}s ({total / elapsed:.1f} runs/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
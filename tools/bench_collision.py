@@ -0,0 +1,65 @@
+"""Dino collision cost at stress-test densities: scanning every sprite vs.
+the x-ordered broad phase, with candidate counts.
+
+Run from the project root:  python -m tools.bench_collision [--counts 50,200,500]
+"""
+import argparse
+import time
+
+import config
+from collision import candidates, collide
+from entities.coin import Coin
+from entities.obstacle import Obstacle
+from world import World
+
+
+def populated_world(count: int) -> World:
+    # `count` coins and `count` cacti spread evenly over the screen.
+    world = World(seed=0, particles=False)
+    step = config.SCREEN_WIDTH / count
+    for i in range(count):
+        x = i * step
+        world.place(world.coin_list, Coin(x, config.GROUND_Y + 12))
+        cactus = Obstacle()
+        cactus.center_x = x + step / 2
+        world.place(world.obstacle_list, cactus)
+    world.snapshot_positions()
+    return world
+
+
+def timed(iterations: int, fn) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", default="50,200,500")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    reach = Obstacle().width * 0.5 + 10.0
+    print(f"{'entities':>8} {'candidates':>10} {'scan us':>10} {'broad us':>10}")
+    for count in (int(c) for c in args.counts.split(",")):
+        world = populated_world(count)
+        dino, prev = world.dino, world.prev_positions
+        lists = (world.coin_list, world.obstacle_list)
+
+        def scan():
+            for sprites in lists:
+                collide(dino, sprites, prev)
+
+        def broad():
+            for sprites in lists:
+                collide(dino, candidates(dino, sprites, prev, reach), prev)
+
+        found = sum(len(candidates(dino, sprites, prev, reach)) for sprites in lists)
+        before = timed(args.iterations, scan)
+        after = timed(args.iterations, broad)
+        print(f"{count * 2:>8} {found:>10} {before * 1e6:>10.1f} {after * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Particle update cost: one SpriteSolidColor per particle vs. the NumPy
+ParticleEmitter, at a steady live count.
+
+Run from the project root:  python -m tools.bench_particles [--counts 50,200,1000]
+"""
+import argparse
+import random
+import time
+
+import arcade
+
+import config
+from entities.particle import DUST_PARTICLE, ParticleEmitter
+
+
+class LegacyParticle(arcade.SpriteSolidColor):
+    # Previous behaviour: a sprite per particle with its own Python update.
+    def __init__(self, size, velocity_x, velocity_y, x, y, life):
+        super().__init__(size, size, center_x=x, center_y=y, color=arcade.color.BLACK)
+        self.life = self.start_life = life
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+
+    def update(self, delta_time: float):
+        self.center_x += self.velocity_x * delta_time
+        self.center_y += self.velocity_y * delta_time
+        self.life -= delta_time
+        self.alpha = int(255 * max(self.life / self.start_life, 0.0))
+        if self.life <= 0:
+            self.remove_from_sprite_lists()
+
+
+def legacy_emit(sprites, rng):
+    size = rng.randint(*DUST_PARTICLE.width)
+    vx = rng.uniform(*DUST_PARTICLE.velocity_x)
+    vy = rng.uniform(*DUST_PARTICLE.velocity_y)
+    sprites.append(LegacyParticle(size, vx, vy, 400, 100, DUST_PARTICLE.life))
+
+
+def timed(count: int, steps: int, emit, update) -> float:
+    # Emit at the rate that keeps `count` particles alive, then time steps.
+    dt = 1.0 / config.SIMULATION_TICK_RATE
+    per_step = count * dt / DUST_PARTICLE.life
+    owed = 0.0
+    start = None
+    for i in range(steps * 2):
+        if i == steps:
+            start = time.perf_counter()
+        owed += per_step
+        while owed >= 1.0:
+            emit()
+            owed -= 1.0
+        update(dt)
+    return (time.perf_counter() - start) / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", default="50,200,1000")
+    parser.add_argument("--steps", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'live':>6} {'sprites us':>11} {'emitter us':>11}")
+    for count in (int(c) for c in args.counts.split(",")):
+        rng = random.Random(0)
+        sprites = arcade.SpriteList()
+        before = timed(
+            count, args.steps, lambda: legacy_emit(sprites, rng), sprites.update
+        )
+        rng = random.Random(0)
+        emitter = ParticleEmitter(capacity=count * 2)
+        after = timed(
+            count,
+            args.steps,
+            lambda: emitter.emit(DUST_PARTICLE, 400, 100, rng),
+            emitter.update,
+        )
+        print(f"{count:>6} {before * 1e6:>11.1f} {after * 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""PhysicsEngine.update timings: the previous hasattr-probing step vs. the
+straight-line step with capabilities bound at construction.
+
+Run from the project root:  python -m tools.bench_physics [--steps N] [--repeat N]
+"""
+import argparse
+import statistics
+import time
+
+import config
+from entities.dino import Dino
+from physics import PhysicsEngine, PhysicsParams
+
+
+class LegacyPhysicsEngine:
+    # Previous behaviour: probe the dino's capabilities on every step.
+    def __init__(self, dino):
+        self.dino = dino
+
+    def update(self, delta_time: float, params: PhysicsParams) -> None:
+        if hasattr(self.dino, "jump_buffer_left"):
+            self.dino.jump_buffer_left = max(
+                self.dino.jump_buffer_left - delta_time, 0.0
+            )
+        if hasattr(self.dino, "coyote_time_left"):
+            self.dino.coyote_time_left = max(
+                self.dino.coyote_time_left - delta_time, 0.0
+            )
+        self.dino.velocity_y -= params.gravity * delta_time
+        if self.dino.velocity_y < 0:
+            self.dino.velocity_y += (
+                -self.dino.velocity_y * config.AIR_DRAG * delta_time
+            )
+        if self.dino.velocity_y < -config.TERMINAL_VELOCITY:
+            self.dino.velocity_y = -config.TERMINAL_VELOCITY
+        self.dino.center_y += self.dino.velocity_y * delta_time
+
+        if self.dino.bottom <= config.GROUND_Y:
+            self.dino.bottom = config.GROUND_Y
+            self.dino.velocity_y = 0
+            self.dino.on_ground = True
+            if hasattr(self.dino, "jump_count"):
+                self.dino.jump_count = 0
+            if hasattr(self.dino, "coyote_time_left"):
+                self.dino.coyote_time_left = config.COYOTE_TIME
+        if hasattr(self.dino, "try_consume_jump"):
+            self.dino.try_consume_jump()
+
+
+def timed(engine_cls, steps: int) -> float:
+    # Jump every 90 ticks so the airborne and landing branches both run.
+    dino = Dino(x=100)
+    engine = engine_cls(dino)
+    params = PhysicsParams()
+    dt = 1.0 / config.SIMULATION_TICK_RATE
+    velocity = config.GRAVITY_NORMAL * config.JUMP_TIME_TO_APEX
+    start = time.perf_counter()
+    for i in range(steps):
+        if i % 90 == 0:
+            dino.request_jump(velocity)
+        engine.update(dt, params)
+    return (time.perf_counter() - start) / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=6)
+    args = parser.parse_args()
+
+    # Alternate which engine runs first so warm-up and drift don't favour
+    # either side, and compare medians.
+    engines = {"before": LegacyPhysicsEngine, "after": PhysicsEngine}
+    times = {"before": [], "after": []}
+    ratios = []
+    print(f"{'round':>5} {'first':>6} {'before ns':>10} {'after ns':>9} {'speedup':>8}")
+    for round_ in range(args.repeat):
+        order = ["before", "after"] if round_ % 2 == 0 else ["after", "before"]
+        result = {name: timed(engines[name], args.steps) for name in order}
+        for name, per_step in result.items():
+            times[name].append(per_step)
+        ratios.append(result["before"] / result["after"])
+        print(
+            f"{round_:>5} {order[0]:>6} {result['before'] * 1e9:>10.0f} "
+            f"{result['after'] * 1e9:>9.0f} {ratios[-1]:>7.2f}x"
+        )
+    before = statistics.median(times["before"])
+    after = statistics.median(times["after"])
+    print(
+        f"median of {args.repeat}: before {before * 1e9:.0f} ns/step, "
+        f"after {after * 1e9:.0f} ns/step, speedup x{statistics.median(ratios):.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
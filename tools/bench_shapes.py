@@ -0,0 +1,126 @@
+"""Hitbox-mode (USE_SPRITES = False) world drawing: one immediate-mode
+rectangle call per entity vs. the batched ShapeRenderer. Counts GPU draw
+calls and bytes uploaded per frame, and CPU time per frame.
+
+Run from the project root:  python -m tools.bench_shapes [--counts 100,250,500]
+(set ARCADE_HEADLESS=1 to run without a display)
+"""
+import argparse
+import time
+
+import arcade
+from arcade.gl import Geometry
+
+from graphics.shapes import ShapeRenderer
+from tools.bench_collision import populated_world
+
+
+def legacy_draw(world, alpha, offset):
+    # Previous behaviour: an immediate-mode call per entity (two per obstacle).
+    for coin in world.coin_list:
+        arcade.draw_lbwh_rectangle_filled(
+            coin.left, coin.bottom, coin.width, coin.height, coin.color
+        )
+    for powerup in world.powerup_list:
+        arcade.draw_lbwh_rectangle_filled(
+            powerup.left, powerup.bottom, powerup.width, powerup.height, powerup.color
+        )
+    for sprite_list in (world.meteor_list, world.dino_list):
+        for sprite in sprite_list:
+            dx, dy = offset(sprite, alpha)
+            arcade.draw_lbwh_rectangle_filled(
+                sprite.left + dx,
+                sprite.bottom + dy,
+                sprite.width,
+                sprite.height,
+                sprite.color,
+            )
+    for obs in world.obstacle_list:
+        arcade.draw_lbwh_rectangle_filled(
+            obs.left, obs.bottom, obs.width, obs.height, arcade.color.WHITE
+        )
+        arcade.draw_lbwh_rectangle_outline(
+            obs.left, obs.bottom, obs.width, obs.height, arcade.color.BLACK, 2
+        )
+
+
+class Counters:
+    # Wraps Geometry.render and the backend's Buffer.write to count calls
+    # and uploaded bytes.
+    def __init__(self, ctx):
+        self.calls = 0
+        self.bytes = 0
+        buffer_cls = type(ctx.buffer(reserve=4))
+        render, write = Geometry.render, buffer_cls.write
+
+        def counted_render(geometry, *args, **kwargs):
+            self.calls += 1
+            return render(geometry, *args, **kwargs)
+
+        def counted_write(buffer, data, *args, **kwargs):
+            self.bytes += memoryview(data).nbytes
+            return write(buffer, data, *args, **kwargs)
+
+        Geometry.render = counted_render
+        buffer_cls.write = counted_write
+
+    def reset(self):
+        self.calls = self.bytes = 0
+
+
+def measure(window, counters, frames, draw):
+    # Returns (draw calls, bytes uploaded, seconds) per steady-state frame.
+    window.clear()
+    draw()
+    counters.reset()
+    start = time.perf_counter()
+    for _ in range(frames):
+        window.clear()
+        draw()
+    window.ctx.finish()
+    elapsed = (time.perf_counter() - start) / frames
+    return counters.calls / frames, counters.bytes / frames, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", default="100,250,500")
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    window = arcade.Window(800, 600, "bench_shapes", visible=False)
+    counters = Counters(window.ctx)
+
+    def no_offset(sprite, alpha):
+        return 0.0, 0.0
+
+    print(
+        f"{'entities':>8} {'calls before':>12} {'calls after':>11} "
+        f"{'bytes before':>12} {'bytes after':>11} {'us before':>10} {'us after':>9}"
+    )
+    for count in (int(c) for c in args.counts.split(",")):
+        world = populated_world(count)
+        renderer = ShapeRenderer()
+        entities = sum(
+            len(sprites)
+            for sprites in (world.coin_list, world.obstacle_list, world.dino_list)
+        )
+        calls_before, bytes_before, before = measure(
+            window, counters, args.frames, lambda: legacy_draw(world, 1.0, no_offset)
+        )
+        calls_after, bytes_after, after = measure(
+            window,
+            counters,
+            args.frames,
+            lambda: renderer.draw(world, 1.0, no_offset),
+        )
+        print(
+            f"{entities:>8} {calls_before:>12.0f} {calls_after:>11.0f} "
+            f"{bytes_before:>12.0f} {bytes_after:>11.0f} "
+            f"{before * 1e6:>10.0f} {after * 1e6:>9.0f}"
+        )
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
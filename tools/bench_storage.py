@@ -0,0 +1,119 @@
+"""Storage API timings: per-call connections vs. the shared WAL connection
+and background writer. "after" timings include the final flush to disk.
+
+Run from the project root:  python -m tools.bench_storage [--iterations N]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from systems import storage
+
+
+def legacy_record_run(path: str, score: float, coins: int) -> None:
+    # Previous behaviour: a fresh connection (and a full fsync) per call.
+    conn = sqlite3.connect(path)
+    with conn:
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT total_runs, total_coins, best_score, best_coins, coins_balance "
+            "FROM stats WHERE id = 1"
+        )
+        total_runs, total_coins, best_score, best_coins, balance = cur.fetchone()
+        cur.execute(
+            "UPDATE stats SET total_runs = ?, total_coins = ?, best_score = ?, "
+            "best_coins = ?, coins_balance = ? WHERE id = 1",
+            (
+                total_runs + 1,
+                total_coins + coins,
+                max(best_score, score),
+                max(best_coins, coins),
+                balance + coins,
+            ),
+        )
+    conn.close()
+
+
+def legacy_set_setting(path: str, key: str, value: str) -> None:
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(
+            "INSERT INTO settings (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+    conn.close()
+
+
+def timed(label: str, iterations: int, fn) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    storage.flush()
+    per_call = (time.perf_counter() - start) / iterations
+    print(f"{label:<34} {per_call * 1e6:10.1f} us/call")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage.DB_PATH = os.path.join(tmp, "legacy.db")
+        storage.init_db()
+        storage.close()
+        conn = sqlite3.connect(storage.DB_PATH)
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.close()
+        legacy_path = storage.DB_PATH
+
+        print("before: connection per call, rollback journal")
+        before_run = timed(
+            "  record_run", args.iterations,
+            lambda i: legacy_record_run(legacy_path, i, 1),
+        )
+        before_set = timed(
+            "  set_setting", args.iterations,
+            lambda i: legacy_set_setting(legacy_path, "bench", str(i)),
+        )
+
+        storage.DB_PATH = os.path.join(tmp, "wal.db")
+        storage.init_db()
+        print("after: shared connection, WAL, background writer")
+        after_run = timed(
+            "  record_run", args.iterations, lambda i: storage.record_run(i, 1)
+        )
+        after_set = timed(
+            "  set_setting", args.iterations,
+            lambda i: storage.set_setting("bench", str(i)),
+        )
+        timed("  is_owned", args.iterations, lambda i: storage.is_owned("coin_boost"))
+        timed("  get_setting", args.iterations, lambda i: storage.get_setting("bench", "0"))
+
+        print(f"leaderboard over {args.runs} runs")
+        rng = random.Random(0)
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            storage.record_run(rng.uniform(0, 2000), rng.randint(0, 60), 60.0, 3, "NOTHING")
+        storage.flush()
+        elapsed = time.perf_counter() - start
+        print(f"{'  record_run (batched append)':<34} {elapsed / args.runs * 1e6:10.1f} us/call")
+        storage.get_run_count()
+        timed("  get_top_runs(10)", args.iterations, lambda i: storage.get_top_runs(10))
+        timed("  get_recent_runs(10)", args.iterations, lambda i: storage.get_recent_runs(10))
+        timed("  get_score_percentile", args.iterations, lambda i: storage.get_score_percentile(i))
+        timed("  get_percentile_score", args.iterations, lambda i: storage.get_percentile_score(90))
+        storage.close()
+
+    print(f"record_run speedup:  x{before_run / after_run:.1f}")
+    print(f"set_setting speedup: x{before_set / after_set:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Pack every image under assets/ into one atlas image plus a region index.
+
+Writes assets/atlas.png and assets/atlas.json. While both exist, the game
+decodes only the atlas at startup and serves each asset path as a crop of
+it (see graphics.assets.load_atlas). Re-run after changing any image.
+
+Run from the project root:  python -m tools.build_atlas [--width 2048]
+"""
+import argparse
+import json
+import os
+
+from PIL import Image
+
+from graphics.assets import ATLAS_IMAGE, ATLAS_INDEX, scan_assets
+
+PADDING = 2
+
+
+def pack(sizes, width):
+    # Shelf packing, tallest first: fill a row left to right, then start a
+    # new row under it as tall as its first image.
+    order = sorted(sizes, key=lambda path: (-sizes[path][1], path))
+    regions = {}
+    x = y = shelf = 0
+    for path in order:
+        w, h = sizes[path]
+        if w > width:
+            raise SystemExit(f"{path} is {w}px wide; raise --width")
+        if x + w > width:
+            x, y, shelf = 0, y + shelf + PADDING, 0
+        regions[path] = (x, y, w, h)
+        x += w + PADDING
+        shelf = max(shelf, h)
+    return regions, y + shelf
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--width", type=int, default=2048)
+    args = parser.parse_args()
+
+    images = {}
+    for path in scan_assets():
+        if path.endswith(".png") and path not in (ATLAS_IMAGE, ATLAS_INDEX):
+            images[path] = Image.open(path).convert("RGBA")
+    if not images:
+        raise SystemExit("no images under assets/")
+
+    regions, height = pack({p: im.size for p, im in images.items()}, args.width)
+    atlas = Image.new("RGBA", (args.width, height))
+    for path, (x, y, _w, _h) in regions.items():
+        atlas.paste(images[path], (x, y))
+    atlas.save(ATLAS_IMAGE)
+    with open(ATLAS_INDEX, "w", encoding="utf-8") as f:
+        json.dump({"size": [args.width, height], "regions": regions}, f, indent=1)
+
+    used = sum(w * h for _x, _y, w, h in regions.values())
+    print(
+        f"packed {len(regions)} images into {args.width}x{height} "
+        f"({used / (args.width * height):.0%} used), "
+        f"{os.path.getsize(ATLAS_IMAGE)} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
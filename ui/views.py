@@ -1,6 +1,7 @@
 import arcade
 import math
 import random
+import time
 from arcade.camera import Camera2D
 
 import config
@@ -11,17 +12,14 @@ from config import (
     DEBUG_TEXT_COLOR,
 )
 
-from entities.dino import Dino
-from entities.obstacle import Obstacle
-from entities.flying_obstacle import FlyingObstacle
-from entities.particle import make_dust_particle, make_land_particle, make_wind_particle
-from entities.coin import Coin
-from entities.powerup import PowerUp
-from entities.meteor import Meteor
-from physics import PhysicsEngine
-from rules import Rule, RuleManager
-from graphics.assets import load_texture_or_none, resource_path
+from autopilot import Autopilot
+from graphics.assets import resource_path, texture_stats
+from graphics.rects import RectBatch
+from graphics.shapes import ShapeRenderer
 from systems import storage
+from systems.replay import ReplayPlayer, ReplayRecorder
+import world as sim
+from world import World
 
 
 def load_sound_or_none(path: str):
@@ -73,18 +71,28 @@ class Button:
 
 
 class AppContext:
-    def __init__(self):
-        storage.init_db()
-        self.refresh_stats()
-        self.enable_wind = storage.get_setting("enable_wind", "1") == "1"
-        self.enable_day_night = storage.get_setting("enable_day_night", "1") == "1"
-        self.enable_events = storage.get_setting("enable_events", "1") == "1"
-        self.enable_meteors = storage.get_setting("enable_meteors", "1") == "1"
-        self.enable_golden = storage.get_setting("enable_golden", "1") == "1"
-        self.enable_sound = storage.get_setting("enable_sound", "1") == "1"
+    def __init__(
+        self, seed=None, record_path=None, replay=None, replay_speed=1.0, autopilot=False
+    ):
+        self.seed = seed
+        self.record_path = record_path
+        self.replay = replay
+        self.replay_speed = replay_speed
+        self.autopilot = autopilot
+        snapshot = storage.load_snapshot()
+        self.stats = snapshot["stats"]
+        self.owned = snapshot["owned"]
+        settings = snapshot["settings"]
+        self.enable_wind = settings.get("enable_wind", "1") == "1"
+        self.enable_day_night = settings.get("enable_day_night", "1") == "1"
+        self.enable_events = settings.get("enable_events", "1") == "1"
+        self.enable_meteors = settings.get("enable_meteors", "1") == "1"
+        self.enable_golden = settings.get("enable_golden", "1") == "1"
+        self.enable_sound = settings.get("enable_sound", "1") == "1"
 
     def refresh_stats(self):
         self.stats = storage.get_stats()
+        self.owned = storage.get_owned_items()
 
     def set_setting(self, key, value):
         storage.set_setting(key, "1" if value else "0")
@@ -303,7 +311,7 @@ class ShopView(arcade.View):
         )
 
     def try_buy(self, item):
-        if storage.is_owned(item["id"]):
+        if item["id"] in self.app.owned:
             return
         if storage.purchase(item["id"], item["cost"]):
             self.app.refresh_stats()
@@ -341,7 +349,7 @@ class ShopView(arcade.View):
 
         y = SCREEN_HEIGHT / 2 - 80
         for item in self.ITEMS:
-            owned = storage.is_owned(item["id"])
+            owned = item["id"] in self.app.owned
             status = "OWNED" if owned else "LOCKED"
             arcade.draw_text(
                 f"{item['name']}: {status}",
@@ -358,7 +366,7 @@ class ShopView(arcade.View):
             arcade.color.BLACK,
             12,
         )
-        if storage.is_owned("secret_guide"):
+        if "secret_guide" in self.app.owned:
             arcade.draw_text(
                 "Secrets: ↑↑↓↓←→←→ in menu | 100-coin streak = GOLDEN | Meteor = +50",
                 SCREEN_WIDTH / 2,
@@ -805,159 +813,33 @@ class GameView(arcade.View):
         super().__init__()
         self.app = app
         self.camera = Camera2D()
-        self.stats_recorded = False
-        self.load_sounds()
-        self.reset_game()
-        self.setup_rules()
-
-    def setup_rules(self):
-        self.rule_manager = RuleManager(
-            rules=[
-                Rule(
-                    "NOTHING",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_NORMAL,
-                        speed=config.OBSTACLE_SPEED_NORMAL,
-                    ),
-                ),
-                Rule(
-                    "LOW GRAVITY",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_LOW,
-                        speed=config.OBSTACLE_SPEED_NORMAL,
-                    ),
-                ),
-                Rule(
-                    "HIGH GRAVITY",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_HIGH,
-                        speed=config.OBSTACLE_SPEED_NORMAL,
-                    ),
-                ),
-                Rule(
-                    "FAST WORLD",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_NORMAL,
-                        speed=config.OBSTACLE_SPEED_FAST,
-                    ),
-                ),
-                Rule(
-                    "SLOW WORLD",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_NORMAL,
-                        speed=config.OBSTACLE_SPEED_SLOW,
-                    ),
-                ),
-                Rule(
-                    "DOUBLE JUMP",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_NORMAL,
-                        speed=config.OBSTACLE_SPEED_NORMAL,
-                        double_jump=True,
-                    ),
-                ),
-                Rule(
-                    "SLIPPERY FLOOR",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_NORMAL,
-                        speed=config.OBSTACLE_SPEED_NORMAL,
-                        slippery=True,
-                    ),
-                ),
-            ],
-            combo_rules=[
-                Rule(
-                    "FAST + LOW",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_LOW,
-                        speed=config.OBSTACLE_SPEED_FAST,
-                    ),
-                ),
-                Rule(
-                    "SLOW + LOW",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_LOW,
-                        speed=config.OBSTACLE_SPEED_SLOW,
-                    ),
-                ),
-                Rule(
-                    "FAST + DOUBLE",
-                    lambda: self.set_physics(
-                        gravity=config.GRAVITY_NORMAL,
-                        speed=config.OBSTACLE_SPEED_FAST,
-                        double_jump=True,
-                    ),
-                ),
-            ],
-            combo_chance=config.RULE_COMBO_CHANCE,
-            interval=config.RULE_CHANGE_INTERVAL,
-        )
-
-        if self.rule_manager.force_next_rule():
-            if self.rule_manager.current_rule:
-                self.rule_text = self.rule_manager.current_rule.name
-                self.rule_text_timer = 2.0
-
-    def reset_game(self):
-        self.dino_list = arcade.SpriteList()
-        self.obstacle_list = arcade.SpriteList()
-        self.particle_list = arcade.SpriteList()
-        self.coin_list = arcade.SpriteList()
-        self.powerup_list = arcade.SpriteList()
-        self.meteor_list = arcade.SpriteList()
-
-        self.dino = Dino(x=100)
-        self.dino_list.append(self.dino)
-        self.physics_engine = PhysicsEngine(self.dino)
-
-        self.rule_text = ""
-        self.rule_text_timer = 0.0
-        self.spawn_timer = 0.0
-        self.last_obstacle_tag = None
-        self.score = 0.0
-        self.level = 1
-        self.level_text_timer = 0.0
-        self.level_speed_mult = 1.0
-        self.level_color_index = 0
-        self.coins = 0
-        self.game_over = False
-        self.jump_multiplier = 1.0
-        self.particle_timer = 0.0
-        self.footstep_left = True
-        self.move_dir = 0
-        self.player_vel_x = 0.0
-        self.day_time = 0.0
-        self.difficulty_time = 0.0
-        self.wind_timer = 0.0
-        self.wind_time_left = 0.0
-        self.wind_dir = 0
-        self.wind_particle_timer = 0.0
-        self.coin_timer = 0.0
-        self.powerup_timer = 0.0
-        self.meteor_timer = 0.0
-        self.turbo_time_left = 0.0
-        self.shield_time_left = 0.0
-        self.double_jump_time_left = 0.0
-        self.slippery_active = False
-        self.rule_double_jump = False
-        self.rule_stack = 0
+        self.world_camera = Camera2D()
+        self.particle_batch = RectBatch()
+        self.shape_renderer = ShapeRenderer()
         self.stats_recorded = False
         self.paused = False
-        self.difficulty_t = 0.0
-        self.crouch_held = False
-        self.coin_streak = 0
-        self.golden_time_left = 0.0
-        self.event_timer = 0.0
-        self.event_time_left = 0.0
-        self.active_event = None
-        self.next_event_time = random.uniform(
-            config.EVENT_INTERVAL_MIN, config.EVENT_INTERVAL_MAX
-        )
-        if storage.is_owned("start_shield"):
-            self.shield_time_left = 3.0
-
-        min_spawn, max_spawn = self.get_spawn_interval_range()
-        self.next_spawn_time = random.uniform(min_spawn, max_spawn)
+        self.load_sounds()
+        self.player = None
+        self.recorder = None
+        self.autopilot = None
+        if app.replay is not None:
+            self.player = ReplayPlayer(app.replay)
+            self.world = self.player.world
+            self.step_time = 1.0 / app.replay.tick_rate
+            self.time_scale = app.replay_speed
+        else:
+            self.world = World(settings=app, owned=app.owned, seed=app.seed)
+            self.recorder = ReplayRecorder(self.world)
+            if app.autopilot:
+                self.autopilot = Autopilot()
+            self.step_time = 1.0 / config.SIMULATION_TICK_RATE
+            self.time_scale = 1.0
+        self.max_substeps = max(1, int(config.MAX_SUBSTEPS * self.time_scale))
+        self.accumulator = 0.0
+        self.last_substeps = 0
+        self.dropped_time = 0.0
+        self.frame_start = time.perf_counter()
+        self.frame_delta = 0.0
 
     def load_sounds(self):
         self.snd_jump = load_sound_or_none("assets/sfx/jump.wav")
@@ -965,38 +847,22 @@ class GameView(arcade.View):
         self.snd_powerup = load_sound_or_none("assets/sfx/powerup.wav")
         self.snd_hit = load_sound_or_none("assets/sfx/hit.wav")
         self.snd_level = load_sound_or_none("assets/sfx/level_up.wav")
+        self.sounds = {
+            "coin": self.snd_coin,
+            "powerup": self.snd_powerup,
+            "hit": self.snd_hit,
+            "level": self.snd_level,
+        }
 
     def play_sfx(self, sound):
         if sound and self.app.enable_sound:
             arcade.play_sound(sound)
 
-    def update_level(self):
-        if config.LEVEL_SCORE_STEP <= 0:
+    def send_input(self, code):
+        if self.player is not None:
             return
-        new_level = min(config.LEVEL_MAX, int(self.score // config.LEVEL_SCORE_STEP) + 1)
-        if new_level != self.level:
-            self.level = new_level
-            self.level_text_timer = 2.0
-            self.level_speed_mult = 1.0 + (self.level - 1) * config.LEVEL_SPEED_STEP
-            self.level_color_index = max(0, min(self.level - 1, len(config.LEVEL_DAY_COLORS) - 1))
-            self.play_sfx(self.snd_level)
-
-    def set_physics(self, gravity, speed, double_jump=False, slippery=False):
-        config.GRAVITY = gravity
-        config.OBSTACLE_SPEED = speed
-
-        raw_multiplier = math.sqrt(config.GRAVITY_NORMAL / gravity)
-        self.jump_multiplier = max(0.7, min(raw_multiplier, 1.35))
-
-        self.rule_double_jump = double_jump
-        self.slippery_active = slippery
-
-        if gravity == config.GRAVITY_HIGH:
-            config.MAX_JUMP_HEIGHT = config.MAX_JUMP_HEIGHT_HIGH
-        elif gravity == config.GRAVITY_LOW:
-            config.MAX_JUMP_HEIGHT = config.MAX_JUMP_HEIGHT_LOW
-        else:
-            config.MAX_JUMP_HEIGHT = config.MAX_JUMP_HEIGHT_NORMAL
+        self.recorder.record(code)
+        self.world.apply_input(code)
 
     def on_key_press(self, key, modifiers):
         if key == arcade.key.ESCAPE:
@@ -1006,284 +872,183 @@ class GameView(arcade.View):
         if self.paused:
             return
 
-        if key in (arcade.key.SPACE, arcade.key.W) and not self.game_over:
-            base_gravity = config.GRAVITY_NORMAL
-            jump_velocity = (
-                base_gravity * config.JUMP_TIME_TO_APEX * self.jump_multiplier
-            )
-            if hasattr(self.dino, "request_jump"):
-                self.dino.request_jump(jump_velocity)
-            else:
-                self.dino.jump(jump_velocity)
+        world = self.world
+        if key in (arcade.key.SPACE, arcade.key.W) and not world.game_over:
+            self.send_input(sim.INPUT_JUMP_PRESS)
             self.play_sfx(self.snd_jump)
 
-        if key == arcade.key.R and self.game_over:
-            self.reset_game()
-            self.setup_rules()
+        if key == arcade.key.R and world.game_over and self.player is None:
+            world.restart(self.app.seed)
+            self.recorder = ReplayRecorder(world)
+            if self.autopilot is not None:
+                self.autopilot.reset()
+            self.stats_recorded = False
 
-        if key == arcade.key.M and self.game_over:
+        if key == arcade.key.M and world.game_over:
             self.window.show_view(MainMenuView(self.app))
 
-        if key == arcade.key.S and not self.game_over:
-            self.crouch_held = True
+        if key == arcade.key.S:
+            self.send_input(sim.INPUT_CROUCH_PRESS)
 
         if key == arcade.key.A:
-            self.move_dir = -1
+            self.send_input(sim.INPUT_LEFT_PRESS)
         elif key == arcade.key.D:
-            self.move_dir = 1
+            self.send_input(sim.INPUT_RIGHT_PRESS)
 
         if DEV_MODE:
             if key == arcade.key.F1:
-                self.rule_manager.toggle_freeze()
+                self.send_input(sim.INPUT_FREEZE_RULES)
             if key == arcade.key.F2:
-                if self.rule_manager.force_next_rule():
-                    if self.rule_manager.current_rule:
-                        self.rule_text = self.rule_manager.current_rule.name
-                        self.rule_text_timer = 2.0
+                self.send_input(sim.INPUT_NEXT_RULE)
 
     def on_key_release(self, key, modifiers):
         if key == arcade.key.S:
-            self.crouch_held = False
+            self.send_input(sim.INPUT_CROUCH_RELEASE)
         if key in (arcade.key.SPACE, arcade.key.W):
-            if hasattr(self.dino, "cut_jump"):
-                self.dino.cut_jump()
+            self.send_input(sim.INPUT_JUMP_RELEASE)
 
-        if key == arcade.key.A and self.move_dir == -1:
-            self.move_dir = 0
-        elif key == arcade.key.D and self.move_dir == 1:
-            self.move_dir = 0
+        if key == arcade.key.A:
+            self.send_input(sim.INPUT_LEFT_RELEASE)
+        elif key == arcade.key.D:
+            self.send_input(sim.INPUT_RIGHT_RELEASE)
 
     def on_update(self, delta_time):
+        self.frame_start = time.perf_counter()
+        self.frame_delta = delta_time
         if self.paused:
             return
-        if self.game_over:
+        if self.world.game_over:
             return
 
-        was_on_ground = self.dino.on_ground
-        self.physics_engine.update(delta_time)
-        self.dino.is_crouching = self.crouch_held and self.dino.on_ground
-        if not was_on_ground and self.dino.on_ground:
-            self.spawn_land_burst()
-
-        if self.app.enable_day_night:
-            self.day_time += delta_time
-
-        self.difficulty_time += delta_time
-        self.difficulty_t = min(
-            self.difficulty_time / max(config.DIFFICULTY_RAMP_DURATION, 1.0), 1.0
-        )
-
-        if self.app.enable_wind or self.active_event == "STORM":
-            self.update_wind(delta_time)
-        else:
-            self.wind_time_left = 0.0
-            self.wind_dir = 0
-
-        self.update_powerups(delta_time)
-        self.update_speed_multiplier()
-        self.update_events(delta_time)
-
-        if self.golden_time_left > 0:
-            self.golden_time_left = max(0.0, self.golden_time_left - delta_time)
-            self.dino.color = arcade.color.GOLD
-        else:
-            self.dino.color = arcade.color.BLACK
-
-        self.score += delta_time * self.get_score_multiplier()
-        self.update_level()
-        if self.level_text_timer > 0:
-            self.level_text_timer -= delta_time
-        self.spawn_timer += delta_time
-        self.coin_timer += delta_time
-        self.powerup_timer += delta_time
-        self.meteor_timer += delta_time
-
-        if self.spawn_timer >= self.next_spawn_time:
-            self.spawn_timer = 0.0
-            self.spawn_obstacle()
-            min_spawn, max_spawn = self.get_spawn_interval_range()
-            self.next_spawn_time = random.uniform(min_spawn, max_spawn)
-
-        if self.coin_timer >= config.COIN_SPAWN_INTERVAL:
-            self.coin_timer = 0.0
-            coin_chance = config.COIN_SPAWN_CHANCE
-            if self.active_event == "FEVER":
-                coin_chance = min(1.0, coin_chance + config.FEVER_COIN_BONUS)
-            if self.active_event == "DOUBLE COINS":
-                coin_chance = min(1.0, coin_chance + 0.2)
-            if random.random() < coin_chance:
-                self.spawn_coin()
-
-        if self.powerup_timer >= config.POWERUP_SPAWN_INTERVAL:
-            self.powerup_timer = 0.0
-            if random.random() < config.POWERUP_SPAWN_CHANCE:
-                self.spawn_powerup()
-
-        if self.app.enable_meteors and self.meteor_timer >= 1.5:
-            self.meteor_timer = 0.0
-            if random.random() < config.METEOR_SPAWN_CHANCE:
-                self.spawn_meteor()
-
-        self.update_player_movement(delta_time)
-        if self.wind_time_left > 0:
-            wind_force = config.WIND_FORCE
-            if self.active_event == "STORM":
-                wind_force *= config.STORM_WIND_FORCE_MULT
-            self.dino.center_x += self.wind_dir * wind_force * delta_time
-        self.dino.center_x = max(30, min(self.dino.center_x, SCREEN_WIDTH - 30))
-
-        self.dino_list.update(delta_time)
-        self.obstacle_list.update(delta_time)
-        self.coin_list.update(delta_time)
-        self.powerup_list.update(delta_time)
-        self.meteor_list.update(delta_time)
-        self.particle_list.update(delta_time)
-
-        if self.rule_manager.update(delta_time):
-            if self.rule_manager.current_rule:
-                self.rule_text = self.rule_manager.current_rule.name
-                self.rule_text_timer = 2.0
-            self.rule_stack = min(config.RULE_STACK_MAX, self.rule_stack + 1)
-
-        if self.rule_text_timer > 0:
-            self.rule_text_timer -= delta_time
-
-        if self.dino.on_ground:
-            self.particle_timer += delta_time
-            if self.particle_timer >= 0.05:
-                self.particle_timer = 0.0
-                self.spawn_run_dust()
-
-        for coin in arcade.check_for_collision_with_list(self.dino, self.coin_list):
-            coin.remove_from_sprite_lists()
-            coin_mult = (
-                config.DOUBLE_COIN_MULT if self.active_event == "DOUBLE COINS" else 1
-            )
-            if storage.is_owned("coin_boost"):
-                coin_mult *= 1.5
-            coin_gain = int(round(coin_mult))
-            self.coins += coin_gain
-            self.score += 2.0 * coin_mult
-            self.coin_streak += 1
-            self.play_sfx(self.snd_coin)
-            if (
-                self.app.enable_golden
-                and self.coin_streak >= config.GOLDEN_STREAK_COINS
-                and self.golden_time_left <= 0.0
-            ):
-                self.golden_time_left = config.GOLDEN_DURATION
-
-        for powerup in arcade.check_for_collision_with_list(self.dino, self.powerup_list):
-            powerup.remove_from_sprite_lists()
-            self.apply_powerup(powerup.kind)
-            self.play_sfx(self.snd_powerup)
-
-        for meteor in arcade.check_for_collision_with_list(self.dino, self.meteor_list):
-            meteor.remove_from_sprite_lists()
-            self.score += config.METEOR_SCORE_BONUS
-
-        hits = arcade.check_for_collision_with_list(self.dino, self.obstacle_list)
-        if hits:
-            if self.shield_time_left > 0:
-                self.shield_time_left = 0.0
-                for h in hits:
-                    h.remove_from_sprite_lists()
-            else:
-                if not self.game_over:
-                    self.game_over = True
-                    self.record_stats_once()
-                    self.play_sfx(self.snd_hit)
-                    self.window.show_view(GameOverView(self.app, self.score, self.coins))
-            self.coin_streak = 0
+        self.accumulator += delta_time * self.time_scale
+        substeps = 0
+        while self.accumulator >= self.step_time and substeps < self.max_substeps:
+            self.accumulator -= self.step_time
+            substeps += 1
+            if self.player is not None:
+                if self.player.finished:
+                    self.window.show_view(
+                        GameOverView(self.app, self.world.score, self.world.coins)
+                    )
+                    return
+                self.player.feed()
+            elif self.autopilot is not None:
+                self.autopilot.update(self.world, self.send_input)
+            self.world.step(self.step_time)
+            for name in self.world.events:
+                self.play_sfx(self.sounds.get(name))
+            if self.world.game_over:
+                self.finish_run()
+                self.window.show_view(
+                    GameOverView(self.app, self.world.score, self.world.coins)
+                )
+                return
+        if self.accumulator >= self.step_time:
+            # Spiral-of-death guard: drop the backlog instead of catching up.
+            self.dropped_time += self.accumulator - self.step_time
+            self.accumulator = self.step_time
+        self.last_substeps = substeps
+
+    def interpolation_offset(self, sprite, alpha):
+        prev = self.world.prev_positions.get(sprite)
+        if prev is None:
+            return 0.0, 0.0
+        t = alpha - 1.0
+        return (sprite.center_x - prev[0]) * t, (sprite.center_y - prev[1]) * t
+
+    def use_world_camera(self, alpha):
+        world = self.world
+        scroll = world.prev_scroll + (world.scroll - world.prev_scroll) * alpha
+        x, y = self.camera.position
+        self.world_camera.position = (x + scroll, y)
+        self.world_camera.use()
+
+    def draw_interpolated(self, sprite_lists, alpha):
+        moved = []
+        for sprite_list in sprite_lists:
+            for sprite in sprite_list:
+                dx, dy = self.interpolation_offset(sprite, alpha)
+                if dx or dy:
+                    sprite.center_x += dx
+                    sprite.center_y += dy
+                    moved.append((sprite, dx, dy))
+        for sprite_list in sprite_lists:
+            sprite_list.draw()
+        for sprite, dx, dy in moved:
+            sprite.center_x -= dx
+            sprite.center_y -= dy
+
+    def draw_particles(self, alpha):
+        emitter = self.world.particle_emitter
+        n = emitter.count
+        batch = self.particle_batch
+        batch.resize(n)
+        rects = batch.rects
+        prev_x, prev_y = emitter.prev_x[:n], emitter.prev_y[:n]
+        rects["position"][:, 0] = prev_x + (emitter.x[:n] - prev_x) * alpha
+        rects["position"][:, 1] = prev_y + (emitter.y[:n] - prev_y) * alpha
+        rects["size"][:, 0] = emitter.width[:n]
+        rects["size"][:, 1] = emitter.height[:n]
+        rects["color"][:, :3] = emitter.color[:n]
+        rects["color"][:, 3] = emitter.alpha[:n]
+        batch.mark_dirty(0, n)
+        batch.draw()
+
+    def finish_run(self):
+        if self.player is not None:
+            return
+        if self.app.record_path and not self.stats_recorded:
+            self.recorder.finish().save(self.app.record_path)
+        if self.autopilot is not None:
+            # Bot runs stay out of the player's stats and leaderboard.
+            self.stats_recorded = True
+            return
+        self.record_stats_once()
 
     def record_stats_once(self):
         if not self.stats_recorded:
-            storage.record_run(self.score, self.coins)
+            world = self.world
+            current_rule = world.rule_manager.current_rule
+            storage.record_run(
+                world.score,
+                world.coins,
+                duration=world.difficulty_time,
+                level=world.level,
+                rule=current_rule.name if current_rule else None,
+            )
             self.app.refresh_stats()
             self.stats_recorded = True
 
-    def spawn_obstacle(self):
-        bird_chance = config.BIRD_SPAWN_CHANCE + (
-            (config.DIFFICULTY_MAX_BIRD_CHANCE - config.BIRD_SPAWN_CHANCE)
-            * self.difficulty_t
-        )
-        spawn_bird = random.random() < bird_chance
-
-        if spawn_bird:
-            height_type = random.choice(["low", "high"])
-            if self.last_obstacle_tag == "cactus" and height_type == "low":
-                height_type = "high"
-            if self.last_obstacle_tag == "bird_low" and height_type == "low":
-                height_type = "high"
-
-            self.obstacle_list.append(FlyingObstacle(height_type))
-            self.last_obstacle_tag = f"bird_{height_type}"
-        else:
-            roll = random.random()
-            if roll < 0.6:
-                group_size = 1
-            elif roll < 0.85:
-                group_size = 2
-            else:
-                group_size = 3
-
-            base_x = config.SCREEN_WIDTH + config.OBSTACLE_WIDTH
-            spacing = int(config.OBSTACLE_WIDTH * 0.8 + 6)
-            for i in range(group_size):
-                cactus = Obstacle()
-                cactus.center_x = base_x + i * spacing
-                self.obstacle_list.append(cactus)
-
-            self.last_obstacle_tag = f"cactus_{group_size}"
-
     def on_draw(self):
         self.clear()
+        world = self.world
         self.camera.use()
         self.apply_day_night_background()
 
+        alpha = min(self.accumulator / self.step_time, 1.0)
+        # Particles are in screen space; everything else is drawn through a
+        # camera that follows the (interpolated) world scroll.
+        self.draw_particles(alpha)
+        self.use_world_camera(alpha)
         if config.USE_SPRITES:
-            self.particle_list.draw()
-            self.coin_list.draw()
-            self.powerup_list.draw()
-            self.meteor_list.draw()
-            self.dino_list.draw()
-            self.obstacle_list.draw()
+            world.coin_list.draw()
+            world.powerup_list.draw()
+            self.draw_interpolated([world.meteor_list, world.dino_list], alpha)
+            world.obstacle_list.draw()
         else:
-            # Manual rectangle draw to guarantee visibility when using hitbox-only mode.
-            self.particle_list.draw()
-            for coin in self.coin_list:
-                arcade.draw_lbwh_rectangle_filled(
-                    coin.left, coin.bottom, coin.width, coin.height, coin.color
-                )
-            for powerup in self.powerup_list:
-                arcade.draw_lbwh_rectangle_filled(
-                    powerup.left, powerup.bottom, powerup.width, powerup.height, powerup.color
-                )
-            for meteor in self.meteor_list:
-                arcade.draw_lbwh_rectangle_filled(
-                    meteor.left, meteor.bottom, meteor.width, meteor.height, meteor.color
-                )
-            for dino in self.dino_list:
-                arcade.draw_lbwh_rectangle_filled(
-                    dino.left, dino.bottom, dino.width, dino.height, dino.color
-                )
-            for obs in self.obstacle_list:
-                arcade.draw_lbwh_rectangle_filled(
-                    obs.left, obs.bottom, obs.width, obs.height, arcade.color.WHITE
-                )
-                arcade.draw_lbwh_rectangle_outline(
-                    obs.left, obs.bottom, obs.width, obs.height, arcade.color.BLACK, 2
-                )
+            # Hitbox-only mode: batched rectangles, so it is always visible.
+            self.shape_renderer.draw(world, alpha, self.interpolation_offset)
+        self.camera.use()
 
         arcade.draw_text(
-            f"Score: {int(self.score)}",
+            f"Score: {int(world.score)}",
             10,
             SCREEN_HEIGHT - 30,
             arcade.color.BLACK,
             16,
         )
         arcade.draw_text(
-            f"Coins: {self.coins}",
+            f"Coins: {world.coins}",
             10,
             SCREEN_HEIGHT - 52,
             arcade.color.BLACK,
@@ -1291,39 +1056,39 @@ class GameView(arcade.View):
         )
 
         arcade.draw_text(
-            f"Level: {self.level}",
+            f"Level: {world.level}",
             SCREEN_WIDTH - 140,
             SCREEN_HEIGHT - 90,
             arcade.color.BLACK,
             14,
         )
 
-        if self.level_text_timer > 0:
+        if world.level_text_timer > 0:
             arcade.draw_text(
-                f"LEVEL {self.level}",
+                f"LEVEL {world.level}",
                 SCREEN_WIDTH // 2 - 80,
                 SCREEN_HEIGHT // 2 + 80,
                 arcade.color.BLACK,
                 24,
             )
 
-        if self.rule_text:
+        if world.rule_text:
             arcade.draw_text(
-                f"RULE: {self.rule_text}",
+                f"RULE: {world.rule_text}",
                 SCREEN_WIDTH // 2 - 120,
                 SCREEN_HEIGHT - 60,
                 arcade.color.BLACK,
                 18,
             )
-        if self.active_event:
+        if world.active_event:
             arcade.draw_text(
-                f"EVENT: {self.active_event}",
+                f"EVENT: {world.active_event}",
                 SCREEN_WIDTH // 2 - 120,
                 SCREEN_HEIGHT - 84,
                 arcade.color.BLACK,
                 14,
             )
-        if self.golden_time_left > 0:
+        if world.golden_time_left > 0:
             arcade.draw_text(
                 "GOLDEN",
                 SCREEN_WIDTH // 2 - 60,
@@ -1331,16 +1096,16 @@ class GameView(arcade.View):
                 arcade.color.BLACK,
                 14,
             )
-        if self.rule_stack > 0:
+        if world.rule_stack > 0:
             arcade.draw_text(
-                f"STACK x{self.rule_stack}",
+                f"STACK x{world.rule_stack}",
                 SCREEN_WIDTH // 2 - 90,
                 SCREEN_HEIGHT - 132,
                 arcade.color.BLACK,
                 14,
             )
 
-        if self.turbo_time_left > 0:
+        if world.turbo_time_left > 0:
             arcade.draw_text(
                 "TURBO",
                 SCREEN_WIDTH - 120,
@@ -1348,7 +1113,7 @@ class GameView(arcade.View):
                 arcade.color.ORANGE,
                 14,
             )
-        if self.shield_time_left > 0:
+        if world.shield_time_left > 0:
             arcade.draw_text(
                 "SHIELD",
                 SCREEN_WIDTH - 120,
@@ -1356,7 +1121,7 @@ class GameView(arcade.View):
                 arcade.color.CYAN,
                 14,
             )
-        if self.double_jump_time_left > 0 or self.rule_double_jump:
+        if world.double_jump_time_left > 0 or world.rule_double_jump:
             arcade.draw_text(
                 "DOUBLE JUMP",
                 SCREEN_WIDTH - 160,
@@ -1365,7 +1130,7 @@ class GameView(arcade.View):
                 14,
             )
 
-        if self.paused and not self.game_over:
+        if self.paused and not world.game_over:
             arcade.draw_text(
                 "PAUSED",
                 SCREEN_WIDTH // 2 - 60,
@@ -1381,27 +1146,57 @@ class GameView(arcade.View):
                 14,
             )
 
+        # CPU time for this frame's update and draw, before the (slow) DEV
+        # text, drives the particle budget.
+        world.particle_emitter.budget.record_frame(
+            time.perf_counter() - self.frame_start, self.frame_delta
+        )
+
         if DEV_MODE:
             current_rule = (
-                self.rule_manager.current_rule.name
-                if self.rule_manager.current_rule
+                world.rule_manager.current_rule.name
+                if world.rule_manager.current_rule
                 else "-"
             )
             debug_lines = [
-                f"y={int(self.dino.center_y)} vy={int(self.dino.velocity_y)}",
-                f"bbox w={int(self.dino.width)} h={int(self.dino.height)}",
-                f"bottom={int(self.dino.bottom)} top={int(self.dino.top)}",
-                f"state ground={self.dino.on_ground} crouch={self.dino.is_crouching}",
-                f"jumps {self.dino.jump_count}/{self.dino.max_jumps}",
-                f"gravity={int(config.GRAVITY)} jump_mult={self.jump_multiplier:.2f}",
-                f"speed_mult={config.GAME_SPEED_MULTIPLIER:.2f}",
-                f"diff={self.difficulty_t:.2f} t={self.difficulty_time:.1f}s",
-                f"rule={current_rule} stack={self.rule_stack}",
-                f"obstacles={len(self.obstacle_list)}",
-                f"spawn={self.spawn_timer:.2f}/{self.next_spawn_time:.2f}",
-                f"day_time={self.day_time:.1f}s",
-                f"wind={self.wind_dir} t={self.wind_time_left:.1f}",
-                f"powerups t={self.turbo_time_left:.1f} s={self.shield_time_left:.1f} d={self.double_jump_time_left:.1f}",
+                f"y={int(world.dino.center_y)} vy={int(world.dino.velocity_y)}",
+                f"bbox w={int(world.dino.width)} h={int(world.dino.height)}",
+                f"bottom={int(world.dino.bottom)} top={int(world.dino.top)}",
+                f"state ground={world.dino.on_ground} crouch={world.dino.is_crouching}",
+                f"jumps {world.dino.jump_count}/{world.dino.max_jumps}",
+                f"gravity={int(world.params.gravity)} jump_mult={world.params.jump_multiplier:.2f}",
+                f"arc apex={world.jump_table.full.apex:.0f}px air={world.jump_table.full.air_time:.2f}s",
+                f"speed_mult={world.params.speed_multiplier:.2f} scroll={world.params.scroll_speed:.0f}px/s at x={world.scroll:.0f}",
+                f"diff={world.difficulty_t:.2f} t={world.difficulty_time:.1f}s",
+                f"rule={current_rule} stack={world.rule_stack} seed={world.rng.seed}",
+                f"obstacles={len(world.obstacle_list)} tunneled="
+                + (str(world.collision_stats["tunneled"]) if world.collision_stats else "off"),
+                "broadphase {candidates}/{entities}".format(**world.broadphase_stats),
+                "textures hits={hits} loads={loads} missing={missing}".format(
+                    **texture_stats
+                ),
+                "pools used={} cap={} peak={}".format(
+                    *(
+                        sum(getattr(pool, stat) for pool in world.pools.values())
+                        for stat in ("in_use", "capacity", "high_water")
+                    )
+                ),
+                f"spawn={world.spawn_timer:.2f}/{world.next_spawn_time:.2f}",
+                "spawner n={spawns} rej={rejected_unclearable}/{rejected_gap} fb={fallbacks}".format(
+                    **world.spawner.stats
+                ),
+                f"day_time={world.day_time:.1f}s",
+                "particles {}/{} dropped={} budget L{} x{:.2f} frame={:.1f}ms".format(
+                    world.particle_emitter.count,
+                    world.particle_emitter.capacity,
+                    world.particle_emitter.dropped,
+                    world.particle_emitter.budget.level,
+                    world.particle_emitter.budget.emission,
+                    world.particle_emitter.budget.average * 1000,
+                ),
+                f"wind={world.wind_dir} t={world.wind_time_left:.1f}",
+                f"powerups t={world.turbo_time_left:.1f} s={world.shield_time_left:.1f} d={world.double_jump_time_left:.1f}",
+                f"tick={config.SIMULATION_TICK_RATE}Hz substeps={self.last_substeps} dropped={self.dropped_time:.2f}s",
                 "F1: pause rules | F2: next rule",
             ]
             for i, line in enumerate(debug_lines):
@@ -1412,18 +1207,21 @@ class GameView(arcade.View):
                     DEBUG_TEXT_COLOR,
                     12,
                 )
+            self.use_world_camera(alpha)
             self.draw_debug_hitbox()
+            self.camera.use()
 
     def draw_debug_hitbox(self):
+        world = self.world
         arcade.draw_lrbt_rectangle_outline(
-            self.dino.left,
-            self.dino.right,
-            self.dino.bottom,
-            self.dino.top,
+            world.dino.left,
+            world.dino.right,
+            world.dino.bottom,
+            world.dino.top,
             arcade.color.BLACK,
             2,
         )
-        for obs in self.obstacle_list:
+        for obs in world.obstacle_list:
             arcade.draw_lrbt_rectangle_outline(
                 obs.left,
                 obs.right,
@@ -1433,186 +1231,16 @@ class GameView(arcade.View):
                 2,
             )
 
-    def spawn_run_dust(self):
-        foot_offset = -12 if self.footstep_left else 12
-        self.footstep_left = not self.footstep_left
-        x = self.dino.center_x + foot_offset
-        y = self.dino.bottom + 2
-        p = make_dust_particle(x, y)
-        self.particle_list.append(p)
-
-    def spawn_land_burst(self):
-        x = self.dino.center_x - 10
-        y = self.dino.bottom + 6
-        for _ in range(6):
-            p = make_land_particle(x, y)
-            self.particle_list.append(p)
-
-    def update_player_movement(self, delta_time):
-        target = self.move_dir * config.PLAYER_MOVE_SPEED
-        accel_force = (
-            config.PLAYER_ACCEL_SLIPPERY
-            if self.slippery_active
-            else config.PLAYER_ACCEL_NORMAL
-        )
-        friction_force = (
-            config.PLAYER_FRICTION_SLIPPERY
-            if self.slippery_active
-            else config.PLAYER_FRICTION_NORMAL
-        )
-        mass = max(config.PLAYER_MASS, 0.01)
-        accel = accel_force / mass
-        friction = friction_force / mass
-
-        if self.move_dir != 0:
-            self.player_vel_x = self.approach(self.player_vel_x, target, accel * delta_time)
-        else:
-            self.player_vel_x = self.approach(self.player_vel_x, 0.0, friction * delta_time)
-
-        self.dino.center_x += self.player_vel_x * delta_time
-
-    @staticmethod
-    def approach(current, target, delta):
-        if current < target:
-            return min(current + delta, target)
-        if current > target:
-            return max(current - delta, target)
-        return current
-
-    def spawn_coin(self):
-        x = SCREEN_WIDTH + 30
-        y = config.GROUND_Y + 12
-        self.coin_list.append(Coin(x, y))
-
-    def spawn_powerup(self):
-        x = SCREEN_WIDTH + 30
-        y = config.GROUND_Y + 14
-        kind = random.choice(["turbo", "shield", "double_jump"])
-        self.powerup_list.append(PowerUp(kind, x, y))
-
-    def spawn_meteor(self):
-        x = SCREEN_WIDTH + 40
-        y = random.uniform(config.GROUND_Y + 80, SCREEN_HEIGHT - 140)
-        self.meteor_list.append(Meteor(x, y))
-
-    def apply_powerup(self, kind):
-        if kind == "turbo":
-            turbo_mult = 1.5 if storage.is_owned("turbo_plus") else 1.0
-            self.turbo_time_left = config.TURBO_DURATION * turbo_mult
-        elif kind == "shield":
-            self.shield_time_left = config.SHIELD_DURATION
-        elif kind == "double_jump":
-            self.double_jump_time_left = config.DOUBLE_JUMP_DURATION
-
-    def update_powerups(self, delta_time):
-        if self.turbo_time_left > 0:
-            self.turbo_time_left = max(0.0, self.turbo_time_left - delta_time)
-        if self.shield_time_left > 0:
-            self.shield_time_left = max(0.0, self.shield_time_left - delta_time)
-        if self.double_jump_time_left > 0:
-            self.double_jump_time_left = max(
-                0.0, self.double_jump_time_left - delta_time
-            )
-
-        self.dino.max_jumps = (
-            2 if (self.double_jump_time_left > 0 or self.rule_double_jump) else 1
-        )
-
-    def update_events(self, delta_time):
-        if not self.app.enable_events:
-            self.active_event = None
-            self.event_time_left = 0.0
-            return
-        if self.event_time_left > 0:
-            self.event_time_left -= delta_time
-            if self.active_event == "STORM":
-                self.wind_time_left = max(self.wind_time_left, 0.2)
-            if self.event_time_left <= 0:
-                self.active_event = None
-            return
-
-        self.event_timer += delta_time
-        if self.event_timer >= self.next_event_time:
-            self.event_timer = 0.0
-            self.event_time_left = config.EVENT_DURATION
-            self.active_event = random.choice(["FEVER", "STORM", "DOUBLE COINS"])
-            if self.active_event == "STORM":
-                self.wind_time_left = config.WIND_DURATION
-                self.wind_dir = random.choice([-1, 1])
-            self.next_event_time = random.uniform(
-                config.EVENT_INTERVAL_MIN, config.EVENT_INTERVAL_MAX
-            )
-
-    def update_speed_multiplier(self):
-        stack_mult = 1.0 + (self.rule_stack * config.RULE_STACK_SPEED_BONUS)
-        turbo_mult = config.TURBO_SPEED_MULT if self.turbo_time_left > 0 else 1.0
-        difficulty_mult = 1.0 + (
-            (config.DIFFICULTY_MAX_SPEED_MULT - 1.0) * self.difficulty_t
-        )
-        event_mult = 1.0
-        if self.active_event == "STORM":
-            event_mult = 1.15
-        level_mult = self.level_speed_mult
-        config.GAME_SPEED_MULTIPLIER = (
-            stack_mult * turbo_mult * difficulty_mult * event_mult * level_mult
-        )
-
-    def get_score_multiplier(self):
-        base = 1.0 + (self.rule_stack * config.RULE_STACK_SCORE_BONUS)
-        if storage.is_owned("score_boost"):
-            base += 0.1
-        if self.active_event == "FEVER":
-            return base * config.FEVER_SCORE_MULT
-        return base
-
-    def get_spawn_interval_range(self):
-        min_spawn = max(
-            config.DIFFICULTY_MIN_SPAWN_INTERVAL,
-            config.SPAWN_INTERVAL_MIN
-            - (config.SPAWN_INTERVAL_MIN - config.DIFFICULTY_MIN_SPAWN_INTERVAL)
-            * self.difficulty_t,
-        )
-        max_spawn = max(
-            min_spawn,
-            config.SPAWN_INTERVAL_MAX
-            - (config.SPAWN_INTERVAL_MAX - config.DIFFICULTY_MIN_SPAWN_INTERVAL)
-            * self.difficulty_t,
-        )
-        return min_spawn, max_spawn
-
-    def update_wind(self, delta_time):
-        if self.wind_time_left > 0:
-            self.wind_time_left -= delta_time
-            self.wind_particle_timer += delta_time
-            if self.wind_particle_timer >= config.WIND_PARTICLE_RATE:
-                self.wind_particle_timer = 0.0
-                self.spawn_wind_streak()
-            return
-
-        self.wind_timer += delta_time
-        if self.wind_timer >= config.WIND_INTERVAL:
-            self.wind_timer = 0.0
-            self.wind_time_left = config.WIND_DURATION
-            self.wind_dir = random.choice([-1, 1])
-            self.wind_particle_timer = 0.0
-
-    def spawn_wind_streak(self):
-        if self.wind_dir == 0:
-            return
-        x = -20 if self.wind_dir > 0 else SCREEN_WIDTH + 20
-        y = random.uniform(config.GROUND_Y + 40, SCREEN_HEIGHT - 80)
-        p = make_wind_particle(x, y, self.wind_dir)
-        self.particle_list.append(p)
-
     def apply_day_night_background(self):
-        level_idx = self.level_color_index
+        world = self.world
+        level_idx = world.level_color_index
         day_color = config.LEVEL_DAY_COLORS[level_idx]
         night_color = config.LEVEL_NIGHT_COLORS[level_idx]
         if not self.app.enable_day_night:
             arcade.set_background_color(day_color)
             return
 
-        t = (self.day_time % config.DAY_NIGHT_CYCLE) / config.DAY_NIGHT_CYCLE
+        t = (world.day_time % config.DAY_NIGHT_CYCLE) / config.DAY_NIGHT_CYCLE
         mix = 0.5 - 0.5 * math.cos(t * math.tau)
 
         def lerp(a, b, m):
@@ -1632,3 +1260,4 @@ class GameView(arcade.View):
                 SCREEN_HEIGHT,
                 (0, 0, 0, alpha),
             )
+
@@ -0,0 +1,786 @@
+import math
+from dataclasses import dataclass, replace
+
+import arcade
+
+import config
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+from entities.dino import Dino
+from entities.obstacle import Obstacle
+from entities.flying_obstacle import FlyingObstacle
+from entities.particle import (
+    DUST_PARTICLE,
+    LAND_PARTICLE,
+    WIND_PARTICLE,
+    ParticleEmitter,
+)
+from entities.coin import Coin
+from entities.powerup import PowerUp
+from entities.meteor import Meteor
+import jump_arcs
+from collision import candidates, collide, insert_by_x
+from physics import PhysicsEngine, PhysicsParams
+from rules import Rule, RuleManager
+from spawner import BIRD_WIDTH, CACTUS_SPACING, ObstacleSpawner
+from systems.pools import SpritePool, release
+from systems.rng import RandomStreams
+
+
+# Player inputs, as recorded in replays.
+INPUT_JUMP_PRESS = 0
+INPUT_JUMP_RELEASE = 1
+INPUT_CROUCH_PRESS = 2
+INPUT_CROUCH_RELEASE = 3
+INPUT_LEFT_PRESS = 4
+INPUT_LEFT_RELEASE = 5
+INPUT_RIGHT_PRESS = 6
+INPUT_RIGHT_RELEASE = 7
+INPUT_FREEZE_RULES = 8
+INPUT_NEXT_RULE = 9
+
+# Scroll distance after which world x coordinates are shifted back towards
+# zero, keeping them exact in the float32 vertex buffers.
+SCROLL_REBASE = float(2 ** 20)
+
+
+@dataclass
+class WorldSettings:
+    enable_wind: bool = True
+    enable_day_night: bool = True
+    enable_events: bool = True
+    enable_meteors: bool = True
+    enable_golden: bool = True
+
+
+class World:
+    """Window-free game simulation: spawning, physics, rules, events,
+    powerups and collisions.
+
+    `settings` is anything exposing the enable_* flags of WorldSettings
+    (AppContext does). Sound cues raised during a step are collected in
+    `events` for the caller to play. All randomness comes from per-subsystem
+    streams derived from `seed`, so equal seeds and inputs replay exactly.
+    `particles=False` skips cosmetic particles for batch runs.
+
+    Obstacles, coins and powerups stay at a fixed world x. Scrolling only
+    advances `scroll`, the world x of the screen's left edge, and carries
+    the dino along; meteors move relative to it. Particles live in screen
+    space. Renderers draw world lists through a camera offset by `scroll`.
+
+    Objects in `static_listeners` are told when an obstacle, coin or
+    powerup is placed (`spawned(sprite, sprite_list)`) or despawned
+    (`despawned(sprite)`), and when a scroll rebase moves them all
+    (`shifted(dx)`), so they can mirror those lists without rescanning.
+    """
+
+    def __init__(self, settings=None, owned=frozenset(), seed=None, particles=True):
+        self.settings = settings if settings is not None else WorldSettings()
+        self.owned = owned
+        self.particles = particles
+        self.events = []
+        self.prev_positions = {}
+        self.static_listeners = []
+        self.rng = RandomStreams(seed)
+        # Jump tables are planned at the step time the world is driven at;
+        # step() switches tables if the caller uses another one.
+        self.step_dt = 1.0 / config.SIMULATION_TICK_RATE
+        # Spawned sprites are recycled, so steady play allocates none.
+        self.pools = {
+            "cactus": SpritePool(Obstacle),
+            "bird": SpritePool(FlyingObstacle),
+            "coin": SpritePool(Coin),
+            "powerup": SpritePool(PowerUp),
+            "meteor": SpritePool(Meteor),
+        }
+        self.particle_emitter = ParticleEmitter()
+        self.reset()
+        self.setup_rules()
+
+    def restart(self, seed=None):
+        self.rng = RandomStreams(seed)
+        self.release_all()
+        self.reset()
+        self.setup_rules()
+
+    def emit(self, name):
+        self.events.append(name)
+
+    def setup_rules(self):
+        self.rule_manager = RuleManager(
+            rules=[
+                Rule(
+                    "NOTHING",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_NORMAL,
+                        speed=config.OBSTACLE_SPEED_NORMAL,
+                    ),
+                ),
+                Rule(
+                    "LOW GRAVITY",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_LOW,
+                        speed=config.OBSTACLE_SPEED_NORMAL,
+                    ),
+                ),
+                Rule(
+                    "HIGH GRAVITY",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_HIGH,
+                        speed=config.OBSTACLE_SPEED_NORMAL,
+                    ),
+                ),
+                Rule(
+                    "FAST WORLD",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_NORMAL,
+                        speed=config.OBSTACLE_SPEED_FAST,
+                    ),
+                ),
+                Rule(
+                    "SLOW WORLD",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_NORMAL,
+                        speed=config.OBSTACLE_SPEED_SLOW,
+                    ),
+                ),
+                Rule(
+                    "DOUBLE JUMP",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_NORMAL,
+                        speed=config.OBSTACLE_SPEED_NORMAL,
+                        double_jump=True,
+                    ),
+                ),
+                Rule(
+                    "SLIPPERY FLOOR",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_NORMAL,
+                        speed=config.OBSTACLE_SPEED_NORMAL,
+                        slippery=True,
+                    ),
+                ),
+            ],
+            combo_rules=[
+                Rule(
+                    "FAST + LOW",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_LOW,
+                        speed=config.OBSTACLE_SPEED_FAST,
+                    ),
+                ),
+                Rule(
+                    "SLOW + LOW",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_LOW,
+                        speed=config.OBSTACLE_SPEED_SLOW,
+                    ),
+                ),
+                Rule(
+                    "FAST + DOUBLE",
+                    lambda: self.set_physics(
+                        gravity=config.GRAVITY_NORMAL,
+                        speed=config.OBSTACLE_SPEED_FAST,
+                        double_jump=True,
+                    ),
+                ),
+            ],
+            combo_chance=config.RULE_COMBO_CHANCE,
+            interval=config.RULE_CHANGE_INTERVAL,
+            rng=self.rng.rules,
+        )
+
+        if self.rule_manager.force_next_rule():
+            if self.rule_manager.current_rule:
+                self.rule_text = self.rule_manager.current_rule.name
+                self.rule_text_timer = 2.0
+
+    def release_all(self):
+        for sprite_list in (
+            self.obstacle_list,
+            self.coin_list,
+            self.powerup_list,
+            self.meteor_list,
+        ):
+            for sprite in sprite_list.sprite_list[:]:
+                self.despawn(sprite)
+
+    def reset(self):
+        self.dino_list = arcade.SpriteList()
+        self.obstacle_list = arcade.SpriteList()
+        self.bird_list = arcade.SpriteList()
+        self.particle_emitter.clear()
+        self.coin_list = arcade.SpriteList()
+        self.powerup_list = arcade.SpriteList()
+        self.meteor_list = arcade.SpriteList()
+
+        self.dino = Dino(x=100)
+        self.dino_list.append(self.dino)
+        self.physics_engine = PhysicsEngine(self.dino)
+        self.params = PhysicsParams()
+        self.scroll = 0.0
+        self.prev_scroll = 0.0
+
+        self.rule_text = ""
+        self.rule_text_timer = 0.0
+        self.spawn_timer = 0.0
+        self.spawner = ObstacleSpawner(self.rng.obstacles)
+        self.collision_stats = {"tunneled": 0} if config.DEBUG_TUNNELING else None
+        self.broadphase_stats = {"entities": 0, "candidates": 0}
+        self.score = 0.0
+        self.level = 1
+        self.level_text_timer = 0.0
+        self.level_speed_mult = 1.0
+        self.level_color_index = 0
+        self.coins = 0
+        self.game_over = False
+        self.tick = 0
+        self.particle_timer = 0.0
+        self.footstep_left = True
+        self.move_dir = 0
+        self.player_vel_x = 0.0
+        self.day_time = 0.0
+        self.difficulty_time = 0.0
+        self.wind_timer = 0.0
+        self.wind_time_left = 0.0
+        self.wind_dir = 0
+        self.wind_particle_timer = 0.0
+        self.coin_timer = 0.0
+        self.powerup_timer = 0.0
+        self.meteor_timer = 0.0
+        self.turbo_time_left = 0.0
+        self.shield_time_left = 0.0
+        self.double_jump_time_left = 0.0
+        self.slippery_active = False
+        self.rule_double_jump = False
+        self.rule_stack = 0
+        self.difficulty_t = 0.0
+        self.crouch_held = False
+        self.coin_streak = 0
+        self.golden_time_left = 0.0
+        self.event_timer = 0.0
+        self.event_time_left = 0.0
+        self.active_event = None
+        self.next_event_time = self.rng.events.uniform(
+            config.EVENT_INTERVAL_MIN, config.EVENT_INTERVAL_MAX
+        )
+        if "start_shield" in self.owned:
+            self.shield_time_left = 3.0
+
+        min_spawn, max_spawn = self.get_spawn_interval_range()
+        self.next_spawn_time = self.rng.obstacles.uniform(min_spawn, max_spawn)
+
+    def update_level(self):
+        if config.LEVEL_SCORE_STEP <= 0:
+            return
+        new_level = min(config.LEVEL_MAX, int(self.score // config.LEVEL_SCORE_STEP) + 1)
+        if new_level != self.level:
+            self.level = new_level
+            self.level_text_timer = 2.0
+            self.level_speed_mult = 1.0 + (self.level - 1) * config.LEVEL_SPEED_STEP
+            self.level_color_index = max(0, min(self.level - 1, len(config.LEVEL_DAY_COLORS) - 1))
+            self.emit("level")
+
+    def set_physics(self, gravity, speed, double_jump=False, slippery=False):
+        raw_multiplier = math.sqrt(config.GRAVITY_NORMAL / gravity)
+        jump_multiplier = max(0.7, min(raw_multiplier, 1.35))
+        self.jump_table = jump_arcs.get_table(gravity, jump_multiplier, self.step_dt)
+
+        self.rule_double_jump = double_jump
+        self.slippery_active = slippery
+
+        if gravity == config.GRAVITY_HIGH:
+            max_jump_height = config.MAX_JUMP_HEIGHT_HIGH
+        elif gravity == config.GRAVITY_LOW:
+            max_jump_height = config.MAX_JUMP_HEIGHT_LOW
+        else:
+            max_jump_height = config.MAX_JUMP_HEIGHT_NORMAL
+
+        self.params = replace(
+            self.params,
+            gravity=gravity,
+            obstacle_speed=speed,
+            jump_multiplier=jump_multiplier,
+            max_jump_height=max_jump_height,
+        )
+
+    def press_jump(self):
+        if self.game_over:
+            return
+        base_gravity = config.GRAVITY_NORMAL
+        jump_velocity = (
+            base_gravity * config.JUMP_TIME_TO_APEX * self.params.jump_multiplier
+        )
+        self.dino.request_jump(jump_velocity)
+
+    def release_jump(self):
+        self.dino.cut_jump()
+
+    def set_crouch(self, held):
+        self.crouch_held = held and not self.game_over
+
+    def press_move(self, direction):
+        self.move_dir = direction
+
+    def release_move(self, direction):
+        if self.move_dir == direction:
+            self.move_dir = 0
+
+    def apply_input(self, code):
+        if code == INPUT_JUMP_PRESS:
+            self.press_jump()
+        elif code == INPUT_JUMP_RELEASE:
+            self.release_jump()
+        elif code == INPUT_CROUCH_PRESS:
+            self.set_crouch(True)
+        elif code == INPUT_CROUCH_RELEASE:
+            self.set_crouch(False)
+        elif code == INPUT_LEFT_PRESS:
+            self.press_move(-1)
+        elif code == INPUT_LEFT_RELEASE:
+            self.release_move(-1)
+        elif code == INPUT_RIGHT_PRESS:
+            self.press_move(1)
+        elif code == INPUT_RIGHT_RELEASE:
+            self.release_move(1)
+        elif code == INPUT_FREEZE_RULES:
+            self.toggle_freeze_rules()
+        elif code == INPUT_NEXT_RULE:
+            self.force_next_rule()
+
+    def toggle_freeze_rules(self):
+        self.rule_manager.toggle_freeze()
+
+    def force_next_rule(self):
+        if self.rule_manager.force_next_rule():
+            if self.rule_manager.current_rule:
+                self.rule_text = self.rule_manager.current_rule.name
+                self.rule_text_timer = 2.0
+
+    def snapshot_positions(self):
+        # Obstacles, coins and powerups never move in world space.
+        self.prev_scroll = self.scroll
+        self.prev_positions = {
+            sprite: (sprite.center_x, sprite.center_y)
+            for sprite_list in (self.dino_list, self.meteor_list)
+            for sprite in sprite_list
+        }
+        self.particle_emitter.snapshot()
+
+    def rebase_scroll(self):
+        self.scroll -= SCROLL_REBASE
+        for sprite_list in (
+            self.dino_list,
+            self.obstacle_list,
+            self.coin_list,
+            self.powerup_list,
+            self.meteor_list,
+        ):
+            for sprite in sprite_list:
+                sprite.center_x -= SCROLL_REBASE
+        for listener in self.static_listeners:
+            listener.shifted(-SCROLL_REBASE)
+
+    def advance_scroll(self, delta_time):
+        distance = self.params.scroll_speed * delta_time
+        self.scroll += distance
+        self.dino.center_x += distance
+
+    def place(self, sprite_list, sprite):
+        insert_by_x(sprite_list, sprite)
+        for listener in self.static_listeners:
+            listener.spawned(sprite, sprite_list)
+
+    def despawn(self, sprite):
+        release(sprite)
+        for listener in self.static_listeners:
+            listener.despawned(sprite)
+
+    def despawn_behind(self, sprite_list):
+        # x-ordered, so whatever scrolled off is at the front.
+        items = sprite_list.sprite_list
+        while items and items[0].right < self.scroll:
+            self.despawn(items[0])
+
+    def step(self, delta_time):
+        self.events.clear()
+        if self.game_over:
+            return
+        self.tick += 1
+        if delta_time != self.step_dt:
+            self.step_dt = delta_time
+            self.jump_table = jump_arcs.get_table(
+                self.params.gravity, self.params.jump_multiplier, delta_time
+            )
+        if self.scroll >= SCROLL_REBASE:
+            self.rebase_scroll()
+        self.snapshot_positions()
+
+        was_on_ground = self.dino.on_ground
+        self.physics_engine.update(delta_time, self.params)
+        self.dino.is_crouching = self.crouch_held and self.dino.on_ground
+        if not was_on_ground and self.dino.on_ground:
+            self.spawn_land_burst()
+
+        if self.settings.enable_day_night:
+            self.day_time += delta_time
+
+        self.difficulty_time += delta_time
+        self.difficulty_t = min(
+            self.difficulty_time / max(config.DIFFICULTY_RAMP_DURATION, 1.0), 1.0
+        )
+
+        if self.settings.enable_wind or self.active_event == "STORM":
+            self.update_wind(delta_time)
+        else:
+            self.wind_time_left = 0.0
+            self.wind_dir = 0
+
+        self.update_powerups(delta_time)
+        self.update_speed_multiplier()
+        self.update_events(delta_time)
+
+        if self.golden_time_left > 0:
+            self.golden_time_left = max(0.0, self.golden_time_left - delta_time)
+            self.dino.color = arcade.color.GOLD
+        else:
+            self.dino.color = arcade.color.BLACK
+
+        self.score += delta_time * self.get_score_multiplier()
+        self.update_level()
+        if self.level_text_timer > 0:
+            self.level_text_timer -= delta_time
+        self.spawn_timer += delta_time
+        self.coin_timer += delta_time
+        self.powerup_timer += delta_time
+        self.meteor_timer += delta_time
+
+        if self.spawn_timer >= self.next_spawn_time:
+            since_last = self.spawn_timer
+            self.spawn_timer = 0.0
+            self.spawn_obstacle(since_last)
+            min_spawn, max_spawn = self.get_spawn_interval_range()
+            self.next_spawn_time = self.rng.obstacles.uniform(min_spawn, max_spawn)
+
+        if self.coin_timer >= config.COIN_SPAWN_INTERVAL:
+            self.coin_timer = 0.0
+            coin_chance = config.COIN_SPAWN_CHANCE
+            if self.active_event == "FEVER":
+                coin_chance = min(1.0, coin_chance + config.FEVER_COIN_BONUS)
+            if self.active_event == "DOUBLE COINS":
+                coin_chance = min(1.0, coin_chance + 0.2)
+            if self.rng.pickups.random() < coin_chance:
+                self.spawn_coin()
+
+        if self.powerup_timer >= config.POWERUP_SPAWN_INTERVAL:
+            self.powerup_timer = 0.0
+            if self.rng.pickups.random() < config.POWERUP_SPAWN_CHANCE:
+                self.spawn_powerup()
+
+        if self.settings.enable_meteors and self.meteor_timer >= 1.5:
+            self.meteor_timer = 0.0
+            if self.rng.pickups.random() < config.METEOR_SPAWN_CHANCE:
+                self.spawn_meteor()
+
+        self.update_player_movement(delta_time)
+        if self.wind_time_left > 0:
+            wind_force = config.WIND_FORCE
+            if self.active_event == "STORM":
+                wind_force *= config.STORM_WIND_FORCE_MULT
+            self.dino.center_x += self.wind_dir * wind_force * delta_time
+        self.advance_scroll(delta_time)
+        self.dino.center_x = max(
+            self.scroll + 30, min(self.dino.center_x, self.scroll + SCREEN_WIDTH - 30)
+        )
+
+        self.dino_list.update(delta_time)
+        self.bird_list.update(delta_time)
+        self.meteor_list.update(delta_time, self.params)
+        self.particle_emitter.update(delta_time)
+        self.despawn_behind(self.obstacle_list)
+        self.despawn_behind(self.coin_list)
+        self.despawn_behind(self.powerup_list)
+        for meteor in self.meteor_list.sprite_list[:]:
+            if meteor.right < self.scroll:
+                release(meteor)
+
+        if self.rule_manager.update(delta_time):
+            if self.rule_manager.current_rule:
+                self.rule_text = self.rule_manager.current_rule.name
+                self.rule_text_timer = 2.0
+            self.rule_stack = min(config.RULE_STACK_MAX, self.rule_stack + 1)
+
+        if self.rule_text_timer > 0:
+            self.rule_text_timer -= delta_time
+
+        if self.dino.on_ground:
+            self.particle_timer += delta_time
+            if self.particle_timer >= 0.05:
+                self.particle_timer = 0.0
+                self.spawn_run_dust()
+
+        # Obstacles, coins and powerups sit still in world space and are
+        # inserted in x order, so the broad phase can binary-search them.
+        # Meteors keep their spawn-time speed and may overtake each other;
+        # there are only ever a few, so they are scanned.
+        self.broadphase_stats["entities"] = 0
+        self.broadphase_stats["candidates"] = 0
+        nearby_coins = self.nearby(self.coin_list, Coin.SIZE * 0.5)
+        for coin in collide(
+            self.dino, nearby_coins, self.prev_positions, self.collision_stats
+        ):
+            self.despawn(coin)
+            coin_mult = (
+                config.DOUBLE_COIN_MULT if self.active_event == "DOUBLE COINS" else 1
+            )
+            if "coin_boost" in self.owned:
+                coin_mult *= 1.5
+            coin_gain = int(round(coin_mult))
+            self.coins += coin_gain
+            self.score += 2.0 * coin_mult
+            self.coin_streak += 1
+            self.emit("coin")
+            if (
+                self.settings.enable_golden
+                and self.coin_streak >= config.GOLDEN_STREAK_COINS
+                and self.golden_time_left <= 0.0
+            ):
+                self.golden_time_left = config.GOLDEN_DURATION
+
+        nearby_powerups = self.nearby(self.powerup_list, PowerUp.SIZE * 0.5)
+        for powerup in collide(
+            self.dino, nearby_powerups, self.prev_positions, self.collision_stats
+        ):
+            self.despawn(powerup)
+            self.apply_powerup(powerup.kind)
+            self.emit("powerup")
+
+        self.broadphase_stats["entities"] += len(self.meteor_list)
+        self.broadphase_stats["candidates"] += len(self.meteor_list)
+        for meteor in collide(
+            self.dino, self.meteor_list, self.prev_positions, self.collision_stats
+        ):
+            release(meteor)
+            self.score += config.METEOR_SCORE_BONUS
+
+        obstacle_half_width = max(config.OBSTACLE_WIDTH, BIRD_WIDTH) * 0.5
+        nearby_obstacles = self.nearby(self.obstacle_list, obstacle_half_width)
+        hits = collide(
+            self.dino, nearby_obstacles, self.prev_positions, self.collision_stats
+        )
+        if hits:
+            if self.shield_time_left > 0:
+                self.shield_time_left = 0.0
+                for h in hits:
+                    self.despawn(h)
+            else:
+                if not self.game_over:
+                    self.game_over = True
+                    self.emit("hit")
+            self.coin_streak = 0
+
+    def nearby(self, sprite_list, reach):
+        found = candidates(self.dino, sprite_list, self.prev_positions, reach)
+        self.broadphase_stats["entities"] += len(sprite_list)
+        self.broadphase_stats["candidates"] += len(found)
+        return found
+
+    def spawn_obstacle(self, since_last=float("inf")):
+        bird_chance = config.BIRD_SPAWN_CHANCE + (
+            (config.DIFFICULTY_MAX_BIRD_CHANCE - config.BIRD_SPAWN_CHANCE)
+            * self.difficulty_t
+        )
+        kind, arg = self.spawner.choose(
+            bird_chance, self.jump_table, self.params.scroll_speed, since_last
+        )
+
+        if kind == "bird":
+            bird = self.pools["bird"].acquire(arg)
+            bird.center_x += self.scroll
+            self.place(self.obstacle_list, bird)
+            self.bird_list.append(bird)
+        else:
+            base_x = self.scroll + config.SCREEN_WIDTH + config.OBSTACLE_WIDTH
+            for i in range(arg):
+                cactus = self.pools["cactus"].acquire()
+                cactus.center_x = base_x + i * CACTUS_SPACING
+                self.place(self.obstacle_list, cactus)
+
+    def spawn_run_dust(self):
+        if not self.particles:
+            return
+        foot_offset = -12 if self.footstep_left else 12
+        self.footstep_left = not self.footstep_left
+        x = self.dino.center_x - self.scroll + foot_offset
+        y = self.dino.bottom + 2
+        self.particle_emitter.emit(DUST_PARTICLE, x, y, self.rng.particles)
+
+    def spawn_land_burst(self):
+        if not self.particles:
+            return
+        x = self.dino.center_x - self.scroll - 10
+        y = self.dino.bottom + 6
+        for _ in range(6):
+            self.particle_emitter.emit(LAND_PARTICLE, x, y, self.rng.particles)
+
+    def update_player_movement(self, delta_time):
+        target = self.move_dir * config.PLAYER_MOVE_SPEED
+        accel_force = (
+            config.PLAYER_ACCEL_SLIPPERY
+            if self.slippery_active
+            else config.PLAYER_ACCEL_NORMAL
+        )
+        friction_force = (
+            config.PLAYER_FRICTION_SLIPPERY
+            if self.slippery_active
+            else config.PLAYER_FRICTION_NORMAL
+        )
+        mass = max(config.PLAYER_MASS, 0.01)
+        accel = accel_force / mass
+        friction = friction_force / mass
+
+        if self.move_dir != 0:
+            self.player_vel_x = self.approach(self.player_vel_x, target, accel * delta_time)
+        else:
+            self.player_vel_x = self.approach(self.player_vel_x, 0.0, friction * delta_time)
+
+        self.dino.center_x += self.player_vel_x * delta_time
+
+    @staticmethod
+    def approach(current, target, delta):
+        if current < target:
+            return min(current + delta, target)
+        if current > target:
+            return max(current - delta, target)
+        return current
+
+    def spawn_coin(self):
+        x = self.scroll + SCREEN_WIDTH + 30
+        y = config.GROUND_Y + 12
+        self.place(self.coin_list, self.pools["coin"].acquire(x, y))
+
+    def spawn_powerup(self):
+        x = self.scroll + SCREEN_WIDTH + 30
+        y = config.GROUND_Y + 14
+        kind = self.rng.pickups.choice(["turbo", "shield", "double_jump"])
+        self.place(self.powerup_list, self.pools["powerup"].acquire(kind, x, y))
+
+    def spawn_meteor(self):
+        x = self.scroll + SCREEN_WIDTH + 40
+        y = self.rng.pickups.uniform(config.GROUND_Y + 80, SCREEN_HEIGHT - 140)
+        self.meteor_list.append(
+            self.pools["meteor"].acquire(x, y, self.params.obstacle_speed)
+        )
+
+    def apply_powerup(self, kind):
+        if kind == "turbo":
+            turbo_mult = 1.5 if "turbo_plus" in self.owned else 1.0
+            self.turbo_time_left = config.TURBO_DURATION * turbo_mult
+        elif kind == "shield":
+            self.shield_time_left = config.SHIELD_DURATION
+        elif kind == "double_jump":
+            self.double_jump_time_left = config.DOUBLE_JUMP_DURATION
+
+    def update_powerups(self, delta_time):
+        if self.turbo_time_left > 0:
+            self.turbo_time_left = max(0.0, self.turbo_time_left - delta_time)
+        if self.shield_time_left > 0:
+            self.shield_time_left = max(0.0, self.shield_time_left - delta_time)
+        if self.double_jump_time_left > 0:
+            self.double_jump_time_left = max(
+                0.0, self.double_jump_time_left - delta_time
+            )
+
+        self.dino.max_jumps = (
+            2 if (self.double_jump_time_left > 0 or self.rule_double_jump) else 1
+        )
+
+    def update_events(self, delta_time):
+        if not self.settings.enable_events:
+            self.active_event = None
+            self.event_time_left = 0.0
+            return
+        if self.event_time_left > 0:
+            self.event_time_left -= delta_time
+            if self.active_event == "STORM":
+                self.wind_time_left = max(self.wind_time_left, 0.2)
+            if self.event_time_left <= 0:
+                self.active_event = None
+            return
+
+        self.event_timer += delta_time
+        if self.event_timer >= self.next_event_time:
+            self.event_timer = 0.0
+            self.event_time_left = config.EVENT_DURATION
+            self.active_event = self.rng.events.choice(["FEVER", "STORM", "DOUBLE COINS"])
+            if self.active_event == "STORM":
+                self.wind_time_left = config.WIND_DURATION
+                self.wind_dir = self.rng.events.choice([-1, 1])
+            self.next_event_time = self.rng.events.uniform(
+                config.EVENT_INTERVAL_MIN, config.EVENT_INTERVAL_MAX
+            )
+
+    def update_speed_multiplier(self):
+        stack_mult = 1.0 + (self.rule_stack * config.RULE_STACK_SPEED_BONUS)
+        turbo_mult = config.TURBO_SPEED_MULT if self.turbo_time_left > 0 else 1.0
+        difficulty_mult = 1.0 + (
+            (config.DIFFICULTY_MAX_SPEED_MULT - 1.0) * self.difficulty_t
+        )
+        event_mult = 1.0
+        if self.active_event == "STORM":
+            event_mult = 1.15
+        level_mult = self.level_speed_mult
+        speed_multiplier = (
+            stack_mult * turbo_mult * difficulty_mult * event_mult * level_mult
+        )
+        # Only swap params when something actually moved the multiplier.
+        if speed_multiplier != self.params.speed_multiplier:
+            self.params = replace(self.params, speed_multiplier=speed_multiplier)
+
+    def get_score_multiplier(self):
+        base = 1.0 + (self.rule_stack * config.RULE_STACK_SCORE_BONUS)
+        if "score_boost" in self.owned:
+            base += 0.1
+        if self.active_event == "FEVER":
+            return base * config.FEVER_SCORE_MULT
+        return base
+
+    def get_spawn_interval_range(self):
+        min_spawn = max(
+            config.DIFFICULTY_MIN_SPAWN_INTERVAL,
+            config.SPAWN_INTERVAL_MIN
+            - (config.SPAWN_INTERVAL_MIN - config.DIFFICULTY_MIN_SPAWN_INTERVAL)
+            * self.difficulty_t,
+        )
+        max_spawn = max(
+            min_spawn,
+            config.SPAWN_INTERVAL_MAX
+            - (config.SPAWN_INTERVAL_MAX - config.DIFFICULTY_MIN_SPAWN_INTERVAL)
+            * self.difficulty_t,
+        )
+        return min_spawn, max_spawn
+
+    def update_wind(self, delta_time):
+        if self.wind_time_left > 0:
+            self.wind_time_left -= delta_time
+            self.wind_particle_timer += delta_time
+            if self.wind_particle_timer >= config.WIND_PARTICLE_RATE:
+                self.wind_particle_timer = 0.0
+                self.spawn_wind_streak()
+            return
+
+        self.wind_timer += delta_time
+        if self.wind_timer >= config.WIND_INTERVAL:
+            self.wind_timer = 0.0
+            self.wind_time_left = config.WIND_DURATION
+            self.wind_dir = self.rng.wind.choice([-1, 1])
+            self.wind_particle_timer = 0.0
+
+    def spawn_wind_streak(self):
+        if self.wind_dir == 0 or not self.particles:
+            return
+        x = -20 if self.wind_dir > 0 else SCREEN_WIDTH + 20
+        y = self.rng.particles.uniform(config.GROUND_Y + 40, SCREEN_HEIGHT - 80)
+        self.particle_emitter.emit(
+            WIND_PARTICLE, x, y, self.rng.particles, direction=self.wind_dir
+        )